@@ -0,0 +1,28 @@
+"""add_tourism_expiry_index_to_customers
+
+Revision ID: d4a7c2e91f3b
+Revises: c87db5e40a35
+Create Date: 2026-10-16 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e91f3b'
+down_revision: Union[str, Sequence[str], None] = 'c87db5e40a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_customers_tourism_regime_expiry', 'customers', ['tourism_regime', 'tourism_regime_expiry'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_customers_tourism_regime_expiry', table_name='customers')
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
 import os
 import uuid
@@ -11,7 +11,7 @@ from app.core.dependencies import get_current_active_user, check_user_limits
 from app.crud.customer import customer_crud, contact_crud
 from app.schemas.customer import (
     Customer, CustomerCreate, CustomerUpdate, CustomerList,
-    Contact, ContactCreate, ContactUpdate
+    Contact, ContactCreate, ContactUpdate, customer_list_adapter
 )
 from app.models.user import User
 
@@ -35,7 +35,9 @@ def list_customers(
         search=search, 
         is_active=is_active
     )
-    return customers
+    customer_list = [CustomerList.from_trusted(customer) for customer in customers]
+    # Serializar directamente a JSON sin revalidar cada fila
+    return Response(content=customer_list_adapter.dump_json(customer_list), media_type="application/json")
 
 @router.get("/{customer_id}", response_model=Customer)
 def get_customer(
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
@@ -11,7 +12,7 @@ from app.schemas.deposit import (
     DepositApplication, DepositApplicationCreate,
     ApplyDepositToInvoice, RefundDeposit,
     CustomerDepositSummary, DepositOperationResponse,
-    DepositType, DepositStatus, Currency
+    DepositType, DepositStatus, Currency, deposit_list_adapter
 )
 from app.crud.deposit import deposit_crud
 
@@ -67,21 +68,16 @@ async def list_deposits(
     for deposit in deposits:
         customer_name = deposit.customer.company_name if deposit.customer else "Cliente desconocido"
         
-        deposit_list.append({
-            "id": deposit.id,
-            "deposit_number": deposit.deposit_number,
-            "customer_id": deposit.customer_id,
-            "customer_name": customer_name,
-            "deposit_type": deposit.deposit_type,
-            "amount": deposit.amount,
-            "currency": deposit.currency,
-            "deposit_date": deposit.deposit_date,
-            "status": deposit.status,
-            "available_amount": deposit.available_amount,
-            "created_at": deposit.created_at
-        })
+        deposit_list.append(DepositList.from_trusted(
+            deposit,
+            customer_name=customer_name,
+            deposit_type=DepositType(deposit.deposit_type),
+            currency=Currency(deposit.currency),
+            status=DepositStatus(deposit.status)
+        ))
     
-    return deposit_list
+    # Serializar directamente a JSON sin revalidar cada fila
+    return Response(content=deposit_list_adapter.dump_json(deposit_list), media_type="application/json")
 
 @router.get("/{deposit_id}", response_model=Deposit)
 async def get_deposit(
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
@@ -11,7 +11,7 @@ from app.models.user import User
 from app.schemas.invoice import (
     Invoice, InvoiceList, InvoiceWithDetails, InvoiceCreate, InvoiceUpdate,
     InvoiceFromOrder, InvoiceSummary, PaymentCreate, Payment,
-    InvoiceStatus, parse_invoice_status
+    InvoiceStatus, parse_invoice_status, invoice_list_adapter
 )
 from app.crud.invoice import invoice_crud
 from app.utils.paraguay_fiscal import ParaguayFiscalValidator
@@ -130,20 +130,14 @@ async def list_invoices(
     for invoice in invoices:
         customer_name = invoice.customer.company_name if invoice.customer else "Cliente desconocido"
         
-        invoice_list.append({
-            "id": invoice.id,
-            "invoice_number": invoice.invoice_number,
-            "customer_id": invoice.customer_id,
-            "customer_name": customer_name,
-            "invoice_date": invoice.invoice_date,
-            "due_date": invoice.due_date,
-            "status": invoice.status,
-            "total_amount": invoice.total_amount,
-            "balance_due": invoice.balance_due,
-            "created_at": invoice.created_at
-        })
+        invoice_list.append(InvoiceList.from_trusted(
+            invoice,
+            customer_name=customer_name,
+            status=InvoiceStatus(invoice.status)
+        ))
     
-    return invoice_list
+    # Serializar directamente a JSON sin revalidar cada fila
+    return Response(content=invoice_list_adapter.dump_json(invoice_list), media_type="application/json")
 
 @router.get("/{invoice_id}", response_model=InvoiceWithDetails)
 async def get_invoice(
@@ -267,7 +261,7 @@ async def get_invoice_pdf(
         from app.services.pdf_generator import pdf_generator
         
         # Generar PDF de factura en buffer
-        pdf_buffer = pdf_generator.generate_invoice_pdf(invoice)
+        pdf_buffer = pdf_generator.generate_invoice_pdf(invoice, db)
         pdf_buffer.seek(0)  # Resetear posición del buffer para lectura
         
         # Nombre del archivo PDF
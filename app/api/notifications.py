@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import Dict, Any
-from datetime import datetime
 
 from app.core.dependencies import get_database, get_current_user
 from app.models.user import User, UserRole
@@ -74,19 +73,19 @@ async def get_customers_with_expiring_tourism(
         raise HTTPException(status_code=403, detail="Acceso denegado")
     
     try:
-        customers = NotificationService.get_customers_with_expiring_tourism(db, days_ahead)
+        customers = [
+            {
+                "id": customer.id,
+                "company_name": customer.company_name,
+                "contact_name": customer.contact_name,
+                "tourism_regime_expiry": customer.tourism_regime_expiry.isoformat() if customer.tourism_regime_expiry is not None else None,
+                "days_until_expiry": customer.days_until
+            }
+            for customer in NotificationService.get_customers_with_expiring_tourism(db, days_ahead)
+        ]
         
         return {
-            "customers": [
-                {
-                    "id": customer.id,
-                    "company_name": customer.company_name,
-                    "contact_name": customer.contact_name,
-                    "tourism_regime_expiry": customer.tourism_regime_expiry.isoformat() if customer.tourism_regime_expiry is not None else None,
-                    "days_until_expiry": (customer.tourism_regime_expiry - datetime.now().date()).days if customer.tourism_regime_expiry is not None else None
-                }
-                for customer in customers
-            ],
+            "customers": customers,
             "total": len(customers),
             "days_ahead": days_ahead
         }
@@ -1,14 +1,15 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_database
 from app.core.dependencies import get_current_active_user
 from app.crud.product import product_crud, product_category_crud, stock_movement_crud
 from app.schemas.product import (
-    Product, ProductCreate, ProductUpdate, ProductList,
+    Product, ProductCreate, ProductUpdate, ProductList, CurrencyEnum,
     ProductCategory, ProductCategoryCreate, ProductCategoryUpdate,
-    StockMovement, StockMovementCreate, StockAdjustment
+    StockMovement, StockMovementCreate, StockAdjustment, product_list_adapter
 )
 from app.models.user import User
 
@@ -79,7 +80,8 @@ def list_products(
     search: Optional[str] = Query(None, description="Buscar por nombre, código o descripción")
 ):
     """Obtener lista de productos con filtros opcionales"""
-    products = product_crud.get_multi(
+    # Las filas ya traen los valores por defecto aplicados y el nombre de la categoría
+    products = product_crud.get_list_rows(
         db=db,
         skip=skip,
         limit=limit,
@@ -90,24 +92,12 @@ def list_products(
         search=search
     )
     
-    # Mapear a ProductList usando model_validate
-    products_list = []
-    for product in products:
-        product_dict = {
-            "id": product.id,
-            "product_code": product.product_code,
-            "name": product.name,
-            "category_name": product.category.name if product.category else None,
-            "selling_price": product.selling_price,
-            "current_stock": product.current_stock if product.current_stock is not None else 0,
-            "is_active": product.is_active if product.is_active is not None else True,
-            "is_trackable": product.is_trackable if product.is_trackable is not None else True,
-            "currency": product.currency if product.currency is not None else "PYG",
-            "expiry_date": product.expiry_date
-        }
-        products_list.append(ProductList.model_validate(product_dict))
-    
-    return products_list
+    # Las filas vienen de la base de datos: se construyen sin revalidar
+    products_list = [
+        ProductList.from_trusted(product, currency=CurrencyEnum(product.currency))
+        for product in products
+    ]
+    return Response(content=product_list_adapter.dump_json(products_list), media_type="application/json")
 
 @router.get("/{product_id}", response_model=Product)
 def get_product(
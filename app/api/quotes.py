@@ -1,15 +1,16 @@
 from typing import List, Optional
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_database
 from app.core.dependencies import get_current_active_user, check_user_limits
 from app.crud.quote import quote_crud
 from app.schemas.quote import (
-    Quote, QuoteCreate, QuoteUpdate, QuoteList, QuoteStatus, QuotePDFResponse, QuoteLine, parse_quote_status
+    Quote, QuoteCreate, QuoteUpdate, QuoteList, QuoteStatus, QuotePDFResponse, QuoteLine, parse_quote_status,
+    quote_list_adapter
 )
-from app.services.pdf_generator import pdf_generator
 from app.models.user import User
 
 router = APIRouter(prefix="/quotes", tags=["cotizaciones"])
@@ -41,20 +42,14 @@ def list_quotes(
     # Mapear a QuoteList (solo campos necesarios para listado)
     quotes_list = []
     for quote in quotes:
-        quote_list = QuoteList(
-            id=quote.id,
-            quote_number=quote.quote_number,
-            customer_id=quote.customer_id,
+        quotes_list.append(QuoteList.from_trusted(
+            quote,
             customer_name=quote.customer.company_name if quote.customer else "",
-            quote_date=quote.quote_date,
-            valid_until=quote.valid_until,
-            status=parse_quote_status(str(quote.status)),
-            total_amount=quote.total_amount,
-            created_at=quote.created_at
-        )
-        quotes_list.append(quote_list)
+            status=parse_quote_status(str(quote.status))
+        ))
     
-    return quotes_list
+    # Serializar directamente a JSON sin revalidar cada fila
+    return Response(content=quote_list_adapter.dump_json(quotes_list), media_type="application/json")
 
 @router.get("/{quote_id}", response_model=Quote)
 def get_quote(
@@ -289,16 +284,19 @@ def generate_quote_pdf(
     current_user: User = Depends(get_current_active_user)
 ):
     """Generar PDF de cotización"""
-    quote = quote_crud.get(db=db, quote_id=quote_id)
+    quote = quote_crud.get_with_details(db=db, quote_id=quote_id)
     if not quote:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cotización no encontrada"
         )
     
+    # Importar aquí: ReportLab solo se carga cuando se genera un PDF
+    from app.services.pdf_generator import pdf_generator
+    
     try:
-        # Generar PDF
-        pdf_path = pdf_generator.generate_quote_pdf(quote)
+        # Generar PDF en memoria para validar que se puede construir
+        pdf_generator.generate_quote_pdf(quote)
         filename = f"cotizacion_{quote.quote_number}.pdf"
         
         return QuotePDFResponse(
@@ -320,31 +318,25 @@ def download_quote_pdf(
     current_user: User = Depends(get_current_active_user)
 ):
     """Descargar PDF de cotización"""
-    quote = quote_crud.get(db=db, quote_id=quote_id)
+    quote = quote_crud.get_with_details(db=db, quote_id=quote_id)
     if not quote:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cotización no encontrada"
         )
     
-    from fastapi.responses import FileResponse
-    import os
+    # Importar aquí: ReportLab solo se carga cuando se genera un PDF
+    from app.services.pdf_generator import pdf_generator
     
     try:
-        # Generar PDF si no existe
-        pdf_path = pdf_generator.generate_quote_pdf(quote)
-        
-        if not os.path.exists(pdf_path):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Archivo PDF no encontrado"
-            )
+        # Generar PDF en memoria y devolverlo directamente
+        pdf_buffer = pdf_generator.generate_quote_pdf(quote)
         
         filename = f"cotizacion_{quote.quote_number}.pdf"
-        return FileResponse(
-            path=pdf_path,
-            filename=filename,
-            media_type="application/pdf"
+        return Response(
+            content=pdf_buffer.getvalue(),
+            media_type="application/pdf",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
         
     except Exception as e:
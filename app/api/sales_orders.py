@@ -1,6 +1,7 @@
 from typing import List, Optional
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_database
@@ -9,7 +10,8 @@ from app.crud.sales_order import sales_order_crud
 from app.crud.quote import quote_crud
 from app.schemas.sales_order import (
     SalesOrder, SalesOrderCreate, SalesOrderUpdate, SalesOrderList, 
-    SalesOrderStatus, SalesOrderLine, parse_sales_order_status
+    SalesOrderStatus, SalesOrderLine, parse_sales_order_status,
+    sales_order_list_adapter
 )
 from app.models.user import User
 
@@ -42,20 +44,14 @@ def list_sales_orders(
     # Mapear a SalesOrderList
     orders_list = []
     for order in orders:
-        order_list = SalesOrderList(
-            id=order.id,
-            order_number=order.order_number,
-            customer_id=order.customer_id,
+        orders_list.append(SalesOrderList.from_trusted(
+            order,
             customer_name=order.customer.company_name if order.customer else "",
-            order_date=order.order_date,
-            delivery_date=order.delivery_date,
-            status=parse_sales_order_status(str(order.status)),
-            total_amount=order.total_amount,
-            created_at=order.created_at
-        )
-        orders_list.append(order_list)
+            status=parse_sales_order_status(str(order.status))
+        ))
     
-    return orders_list
+    # Serializar directamente a JSON sin revalidar cada fila
+    return Response(content=sales_order_list_adapter.dump_json(orders_list), media_type="application/json")
 
 @router.get("/{order_id}", response_model=SalesOrder)
 def get_sales_order(
@@ -208,44 +204,29 @@ def create_order_from_quote(
                 detail="Error al obtener la orden creada desde cotización"
             )
         
-        # Convertir a esquema de respuesta
-        order_response = SalesOrder(
-            id=created_order.id,
-            order_number=created_order.order_number,
-            quote_id=created_order.quote_id,
-            customer_id=created_order.customer_id,
-            order_date=created_order.order_date,
-            delivery_date=created_order.delivery_date,
-            status=parse_sales_order_status(str(created_order.status)),
-            subtotal=created_order.subtotal,
-            tax_amount=created_order.tax_amount,
-            total_amount=created_order.total_amount,
-            shipping_cost=created_order.shipping_cost,
-            shipping_address=created_order.shipping_address,
-            notes=created_order.notes,
-            created_by_id=created_order.created_by_id,
-            created_at=created_order.created_at,
-            updated_at=created_order.updated_at,
-            lines=[],
-            customer_name=created_order.customer.company_name if created_order.customer else "",
-            customer_email=created_order.customer.email if created_order.customer else ""
-        )
-        
-        # Agregar líneas
-        for line in created_order.lines:
-            order_line = SalesOrderLine(
-                id=line.id,
-                order_id=line.order_id,
-                product_id=line.product_id,
-                quantity=line.quantity,
-                unit_price=line.unit_price,
-                discount_percent=line.discount_percent,
-                line_total=line.line_total,
-                description=line.description,
-                quantity_shipped=line.quantity_shipped,
-                quantity_invoiced=line.quantity_invoiced
-            )
-            order_response.lines.append(order_line)
+        # Convertir a esquema de respuesta: las líneas se validan una sola vez,
+        # directamente desde los objetos ORM (FastAPI no revalida la instancia)
+        order_response = SalesOrder.model_validate({
+            "id": created_order.id,
+            "order_number": created_order.order_number,
+            "quote_id": created_order.quote_id,
+            "customer_id": created_order.customer_id,
+            "order_date": created_order.order_date,
+            "delivery_date": created_order.delivery_date,
+            "status": parse_sales_order_status(str(created_order.status)),
+            "subtotal": created_order.subtotal,
+            "tax_amount": created_order.tax_amount,
+            "total_amount": created_order.total_amount,
+            "shipping_cost": created_order.shipping_cost,
+            "shipping_address": created_order.shipping_address,
+            "notes": created_order.notes,
+            "created_by_id": created_order.created_by_id,
+            "created_at": created_order.created_at,
+            "updated_at": created_order.updated_at,
+            "lines": created_order.lines,
+            "customer_name": created_order.customer.company_name if created_order.customer else "",
+            "customer_email": created_order.customer.email if created_order.customer else ""
+        }, from_attributes=True)
         
         return order_response
         
@@ -10,8 +10,8 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
-    # CORS
-    backend_cors_origins: list = ["*"]
+    # CORS: orígenes separados por coma; "*" permite todos
+    backend_cors_origins: list = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
     
     # Redis
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -1,3 +1,4 @@
+from contextlib import closing
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -17,4 +18,8 @@ def get_database():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def session_scope():
+    """Sesión para uso fuera de FastAPI (tareas Celery, scripts): se cierra al salir del bloque with"""
+    return closing(SessionLocal())
\ No newline at end of file
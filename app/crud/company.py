@@ -1,15 +1,55 @@
-from typing import Optional
+import time
+from typing import NamedTuple, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.models.company import CompanySettings
 from app.schemas.company import CompanySettingsCreate, CompanySettingsUpdate
 
+class CompanySnapshot(NamedTuple):
+    """Datos de la empresa que se imprimen en el encabezado de los documentos"""
+    razon_social: str
+    ruc: str
+    direccion: str
+    telefono: str
+    email: str
+    timbrado: str
+    punto_expedicion: str
+
+# Segundos que se reutiliza el snapshot; acota el tiempo en que otro proceso
+# puede seguir viendo datos anteriores a una modificación
+SNAPSHOT_TTL_SECONDS = 60.0
+
 class CRUDCompanySettings:
+    def __init__(self):
+        self._snapshot: Optional[CompanySnapshot] = None
+        self._snapshot_expires_at = 0.0
+    
     def get_settings(self, db: Session) -> Optional[CompanySettings]:
         """Obtener configuración de la empresa (solo debería haber una)"""
         return db.query(CompanySettings).filter(CompanySettings.is_active == True).first()
     
+    def get_snapshot(self, db: Session) -> Optional[CompanySnapshot]:
+        """Obtener los datos de encabezado de la empresa, cacheados en memoria"""
+        now = time.monotonic()
+        if now < self._snapshot_expires_at:
+            return self._snapshot
+        
+        db_company = self.get_settings(db)
+        snapshot = None
+        if db_company:
+            snapshot = CompanySnapshot._make(
+                getattr(db_company, field) or '' for field in CompanySnapshot._fields
+            )
+        
+        self._snapshot = snapshot
+        self._snapshot_expires_at = now + SNAPSHOT_TTL_SECONDS
+        return snapshot
+    
+    def invalidate_snapshot(self) -> None:
+        """Descartar el snapshot cacheado (se llama al modificar la configuración)"""
+        self._snapshot_expires_at = 0.0
+    
     def get_by_id(self, db: Session, company_id: int) -> Optional[CompanySettings]:
         """Obtener configuración por ID"""
         return db.query(CompanySettings).filter(
@@ -29,6 +69,7 @@ class CRUDCompanySettings:
             db.add(db_company)
             db.commit()
             db.refresh(db_company)
+            self.invalidate_snapshot()
             return db_company
         except IntegrityError as e:
             db.rollback()
@@ -51,6 +92,7 @@ class CRUDCompanySettings:
             
             db.commit()
             db.refresh(db_company)
+            self.invalidate_snapshot()
             return db_company
         except IntegrityError as e:
             db.rollback()
@@ -73,6 +115,7 @@ class CRUDCompanySettings:
             
             db.commit()
             db.refresh(db_company)
+            self.invalidate_snapshot()
             return db_company
         except IntegrityError as e:
             db.rollback()
@@ -88,6 +131,7 @@ class CRUDCompanySettings:
         
         db_company.is_active = False  # type: ignore[assignment]
         db.commit()
+        self.invalidate_snapshot()
         return True
     
     def get_next_invoice_number(self, db: Session) -> int:
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, contains_eager
 from sqlalchemy import func, and_, desc, asc
 from typing import List, Optional
 from datetime import date, datetime, timedelta
@@ -10,11 +10,14 @@ from app.models.sales import SalesOrder, SalesOrderLine
 from app.models.product import Product
 from app.schemas.invoice import (
     InvoiceCreate, InvoiceUpdate, InvoiceFromOrder,
-    PaymentCreate, InvoiceStatus, PaymentMethod
+    PaymentCreate, InvoiceStatus, PaymentMethod, validate_invoice_lines
 )
 from app.utils.paraguay_fiscal import ParaguayIVACalculator, ParaguayFiscalUtils
 from app.crud.company import company_settings_crud
 
+# Estados que cuentan como saldo pendiente en el resumen
+_PENDING_STATUS_VALUES = frozenset((InvoiceStatus.PENDING.value, InvoiceStatus.SENT.value))
+
 class InvoiceCRUD:
     def __init__(self):
         self.tax_rate = Decimal('0.16')  # 16% IVA
@@ -94,7 +97,7 @@ class InvoiceCRUD:
                 tourism_regime_applied = True
                 tourism_regime_percentage = Decimal('100')  # 100% exención
                 totals = ParaguayIVACalculator.apply_tourism_regime(
-                    totals, tourism_regime_percentage
+                    totals, tourism_regime_percentage, in_place=True
                 )
         
         subtotal = totals['subtotal']
@@ -227,7 +230,7 @@ class InvoiceCRUD:
             due_date=invoice_data.due_date or date.today(),
             payment_terms=invoice_data.payment_terms,
             notes=invoice_data.notes,
-            lines=invoice_lines
+            lines=validate_invoice_lines(invoice_lines)
         )
         
         return self.create_invoice(db, invoice_create, created_by_id)
@@ -247,7 +250,8 @@ class InvoiceCRUD:
                     start_date: Optional[date] = None,
                     end_date: Optional[date] = None) -> List[Invoice]:
         """Obtener lista de facturas con filtros"""
-        query = db.query(Invoice).join(Customer)
+        # Reutilizar el JOIN con Customer para cargar el nombre sin una consulta por fila
+        query = db.query(Invoice).join(Customer).options(contains_eager(Invoice.customer))
         
         # Aplicar filtros
         if customer_id:
@@ -338,7 +342,7 @@ class InvoiceCRUD:
         total_invoices = len(invoices)
         total_amount = sum(inv.total_amount for inv in invoices)
         paid_amount = sum(inv.paid_amount for inv in invoices)
-        pending_amount = sum(Decimal(str(inv.balance_due)) for inv in invoices if str(inv.status) in [InvoiceStatus.PENDING.value, InvoiceStatus.SENT.value])
+        pending_amount = sum(Decimal(str(inv.balance_due)) for inv in invoices if str(inv.status) in _PENDING_STATUS_VALUES)
         overdue_amount = sum(Decimal(str(inv.balance_due)) for inv in invoices if str(inv.status) == InvoiceStatus.OVERDUE.value)
         
         return {
@@ -1,7 +1,8 @@
 from typing import List, Optional
 from decimal import Decimal
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func
 
 from app.models.product import Product, ProductCategory, StockMovement
 from app.schemas.product import (
@@ -77,8 +78,52 @@ class ProductCRUD:
         search: Optional[str] = None
     ) -> List[Product]:
         """Obtener múltiples productos con filtros"""
-        query = db.query(Product)
+        query = self._apply_filters(
+            db.query(Product), category_id, is_active, is_trackable, low_stock, search
+        )
+        return query.offset(skip).limit(limit).all()
+    
+    def get_list_rows(
+        self, 
+        db: Session, 
+        skip: int = 0, 
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        is_trackable: Optional[bool] = None,
+        low_stock: bool = False,
+        search: Optional[str] = None
+    ) -> List[Row]:
+        """Obtener filas para el listado de productos (solo las columnas de ProductList)"""
+        # Los valores nulos se reemplazan por sus valores por defecto en la propia consulta
+        query = db.query(
+            Product.id,
+            Product.product_code,
+            Product.name,
+            ProductCategory.name.label("category_name"),
+            Product.selling_price,
+            func.coalesce(Product.current_stock, 0).label("current_stock"),
+            func.coalesce(Product.is_active, True).label("is_active"),
+            func.coalesce(Product.is_trackable, True).label("is_trackable"),
+            func.coalesce(Product.currency, "PYG").label("currency"),
+            Product.expiry_date
+        ).outerjoin(ProductCategory, Product.category_id == ProductCategory.id)
         
+        query = self._apply_filters(
+            query, category_id, is_active, is_trackable, low_stock, search
+        )
+        return query.offset(skip).limit(limit).all()
+    
+    def _apply_filters(
+        self,
+        query,
+        category_id: Optional[int],
+        is_active: Optional[bool],
+        is_trackable: Optional[bool],
+        low_stock: bool,
+        search: Optional[str]
+    ):
+        """Aplicar los filtros comunes de productos a una consulta"""
         if category_id:
             query = query.filter(Product.category_id == category_id)
         
@@ -105,7 +150,7 @@ class ProductCRUD:
             )
             query = query.filter(search_filter)
         
-        return query.offset(skip).limit(limit).all()
+        return query
     
     def create(self, db: Session, product_in: ProductCreate) -> Product:
         """Crear nuevo producto"""
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from datetime import date, datetime
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, desc
 
 from app.models.sales import Quote, QuoteLine
@@ -14,6 +14,13 @@ class QuoteCRUD:
         """Obtener cotización por ID"""
         return db.query(Quote).filter(Quote.id == quote_id).first()
     
+    def get_with_details(self, db: Session, quote_id: int) -> Optional[Quote]:
+        """Obtener cotización con cliente, líneas y productos precargados (para PDF)"""
+        return db.query(Quote).options(
+            joinedload(Quote.customer),
+            joinedload(Quote.lines).joinedload(QuoteLine.product)
+        ).filter(Quote.id == quote_id).first()
+    
     def get_by_number(self, db: Session, quote_number: str) -> Optional[Quote]:
         """Obtener cotización por número"""
         return db.query(Quote).filter(Quote.quote_number == quote_number).first()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Numeric, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -40,6 +40,11 @@ class Customer(Base):
     invoices = relationship("Invoice", back_populates="customer")
     deposits = relationship("Deposit", back_populates="customer")
     deposit_summary = relationship("CustomerDepositSummary", back_populates="customer", uselist=False)
+    
+    __table_args__ = (
+        # Búsqueda diaria de regímenes de turismo próximos a vencer
+        Index("ix_customers_tourism_regime_expiry", "tourism_regime", "tourism_regime_expiry"),
+    )
 
 class Contact(Base):
     __tablename__ = "contacts"
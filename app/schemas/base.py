@@ -0,0 +1,75 @@
+from decimal import Decimal
+from enum import Enum
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+_MISSING = object()
+
+# Cero monetario compartido como valor por defecto (Decimal es inmutable)
+ZERO = Decimal("0.00")
+
+class TrustedReadMixin:
+    """Construcción rápida de schemas de lectura a partir de filas ORM confiables.
+
+    Los datos que vienen de la base de datos ya fueron validados al escribirse,
+    por lo que se construye el modelo sin volver a ejecutar los validadores.
+    """
+    __trusted_fields__: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Calcular una sola vez los nombres de campos del modelo
+        cls.__trusted_fields__ = tuple(cls.model_fields)
+
+    @classmethod
+    def from_trusted(cls, obj: Any, **overrides: Any):
+        """Construir el schema desde un objeto ORM sin validación.
+
+        Los atributos que el objeto no tiene se omiten para usar el valor por
+        defecto del campo; ``overrides`` permite pasar campos calculados.
+        """
+        data = {}
+        for name in cls.__trusted_fields__:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                data[name] = value
+        data.update(overrides)
+        return cls.model_construct(**data)
+
+def enum_lookup(enum_cls: Type[Enum], extra: Optional[Dict[Any, Enum]] = None) -> BeforeValidator:
+    """BeforeValidator que resuelve valores a miembros del enum con un dict precalculado.
+
+    Los valores que no están en la tabla se dejan pasar sin cambios para que
+    la validación normal del enum reporte el error.
+    """
+    table: Dict[Any, Enum] = {member.value: member for member in enum_cls}
+    if extra:
+        table.update(extra)
+
+    def _lookup(value: Any) -> Any:
+        try:
+            return table.get(value, value)
+        except TypeError:
+            # Valores no hashables (listas, dicts)
+            return value
+
+    return BeforeValidator(_lookup)
+
+# Campos comunes de las líneas de cotizaciones y órdenes de venta
+class LineItemBase(BaseModel):
+    product_id: int = Field(..., description="ID del producto")
+    quantity: int = Field(..., gt=0, description="Cantidad")
+    unit_price: Decimal = Field(..., ge=0, description="Precio unitario")
+    discount_percent: Decimal = Field(ZERO, ge=0, le=100, description="Descuento en porcentaje")
+    description: Optional[str] = Field(None, description="Descripción del artículo")
+
+class LineItemUpdate(BaseModel):
+    product_id: Optional[int] = None
+    quantity: Optional[int] = None
+    unit_price: Optional[Decimal] = None
+    discount_percent: Optional[Decimal] = None
+    description: Optional[str] = None
+    
+    # Ningún endpoint recibe estos schemas: su validador se construye recién al primer uso
+    model_config = ConfigDict(defer_build=True)
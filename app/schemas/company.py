@@ -1,17 +1,26 @@
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from typing import Literal, Optional
+from enum import StrEnum
 from decimal import Decimal
 from datetime import date
 
-class CurrencyType(str, Enum):
+from app.schemas.base import TrustedReadMixin
+
+# Valores por defecto compartidos (Decimal es inmutable)
+_D10 = Decimal("10.00")
+_D5 = Decimal("5.00")
+
+class CurrencyType(StrEnum):
     PYG = "PYG"  # Guaraníes paraguayos
     USD = "USD"  # Dólares americanos
 
-class PrintFormat(str, Enum):
+class PrintFormat(StrEnum):
     A4 = "A4"
     TICKET = "ticket"
 
+# Regímenes tributarios ofrecidos en la configuración de empresa
+RegimenTributario = Literal["GENERAL", "SIMPLIFICADO", "PEQUENO_CONTRIBUYENTE"]
+
 class CompanySettingsBase(BaseModel):
     # DATOS BÁSICOS DE LA EMPRESA
     razon_social: str
@@ -38,8 +47,8 @@ class CompanySettingsBase(BaseModel):
     moneda_defecto: CurrencyType = CurrencyType.PYG
     
     # CONFIGURACIÓN DE IVA PARA PARAGUAY
-    iva_10_porciento: Decimal = Decimal("10.00")
-    iva_5_porciento: Decimal = Decimal("5.00")
+    iva_10_porciento: Decimal = _D10
+    iva_5_porciento: Decimal = _D5
     iva_exento: bool = False
     
     # CONFIGURACIÓN DE NUMERACIÓN AUTOMÁTICA
@@ -56,7 +65,7 @@ class CompanySettingsBase(BaseModel):
     firma_digital: Optional[str] = None
     
     # CONFIGURACIÓN ESPECÍFICA PARA PARAGUAY
-    regimen_tributario: str = "GENERAL"
+    regimen_tributario: RegimenTributario = "GENERAL"
     contribuyente_iva: bool = True
     
     # INFORMACIÓN ADICIONAL
@@ -145,7 +154,7 @@ class CompanySettingsUpdate(BaseModel):
     formato_impresion: Optional[PrintFormat] = None
     logo_empresa: Optional[str] = None
     firma_digital: Optional[str] = None
-    regimen_tributario: Optional[str] = None
+    regimen_tributario: Optional[RegimenTributario] = None
     contribuyente_iva: Optional[bool] = None
     actividad_economica: Optional[str] = None
     sector_economico: Optional[str] = None
@@ -175,14 +184,14 @@ class CompanySettingsUpdate(BaseModel):
             return v
         return CompanySettingsBase.validate_punto_expedicion(v)
 
-class CompanySettings(CompanySettingsBase):
+class CompanySettings(TrustedReadMixin, CompanySettingsBase):
     id: int
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
-class CompanySettingsPublic(BaseModel):
+class CompanySettingsPublic(TrustedReadMixin, BaseModel):
     """Configuración pública de la empresa (para mostrar en facturas, etc.)"""
     id: int
     razon_social: str
@@ -194,4 +203,4 @@ class CompanySettingsPublic(BaseModel):
     logo_empresa: Optional[str] = None
     moneda_defecto: CurrencyType
     
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
\ No newline at end of file
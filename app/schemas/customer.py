@@ -1,7 +1,19 @@
 from typing import List, Optional
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, model_validator
+
+from app.schemas.base import ZERO, TrustedReadMixin
+
+def _require_future_tourism_expiry(tourism_regime: Optional[bool], expiry: Optional[date], missing_message: str) -> None:
+    """Validar que si tourism_regime=True, exista una fecha de vencimiento futura"""
+    if tourism_regime is True:  # Específicamente True, no None
+        if not expiry:
+            raise ValueError(missing_message)
+        
+        # Verificar que la fecha de vencimiento no sea pasada
+        if expiry <= date.today():
+            raise ValueError("La fecha de vencimiento del régimen de turismo debe ser futura")
 
 # Schemas para Contact
 class ContactBase(BaseModel):
@@ -25,13 +37,14 @@ class ContactUpdate(BaseModel):
     is_primary: Optional[bool] = None
     is_active: Optional[bool] = None
 
-class Contact(ContactBase):
+class Contact(TrustedReadMixin, ContactBase):
+    # El email ya fue validado al guardarse: no volver a validarlo en lectura
+    email: Optional[str] = Field(None, description="Email del contacto")
     id: int
     customer_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para Customer
 class CustomerBase(BaseModel):
@@ -45,7 +58,7 @@ class CustomerBase(BaseModel):
     postal_code: Optional[str] = Field(None, description="Código postal")
     country: str = Field("Paraguay", description="País")
     tax_id: Optional[str] = Field(None, description="RUC o identificación fiscal")
-    credit_limit: Decimal = Field(Decimal("0.00"), description="Límite de crédito")
+    credit_limit: Decimal = Field(ZERO, description="Límite de crédito")
     payment_terms: int = Field(30, description="Términos de pago en días")
     is_active: bool = Field(True, description="Cliente activo")
     
@@ -68,7 +81,7 @@ class CustomerCreate(BaseModel):
     postal_code: Optional[str] = Field(None, description="Código postal")
     country: str = Field("Paraguay", description="País")
     tax_id: Optional[str] = Field(None, description="RUC o identificación fiscal")
-    credit_limit: Decimal = Field(Decimal("0.00"), description="Límite de crédito")
+    credit_limit: Decimal = Field(ZERO, description="Límite de crédito")
     payment_terms: int = Field(30, description="Términos de pago en días")
     is_active: bool = Field(True, description="Cliente activo")
     
@@ -82,14 +95,10 @@ class CustomerCreate(BaseModel):
     @model_validator(mode='after')
     def validate_tourism_regime(self):
         """Validar que si tourism_regime=True, debe tener fecha de vencimiento futura"""
-        if self.tourism_regime:
-            if not self.tourism_regime_expiry:
-                raise ValueError("Si el cliente tiene régimen de turismo, debe proporcionar la fecha de vencimiento del régimen")
-            
-            # Verificar que la fecha de vencimiento no sea pasada
-            if self.tourism_regime_expiry <= date.today():
-                raise ValueError("La fecha de vencimiento del régimen de turismo debe ser futura")
-        
+        _require_future_tourism_expiry(
+            self.tourism_regime, self.tourism_regime_expiry,
+            "Si el cliente tiene régimen de turismo, debe proporcionar la fecha de vencimiento del régimen"
+        )
         return self
 
 class CustomerUpdate(BaseModel):
@@ -117,38 +126,37 @@ class CustomerUpdate(BaseModel):
     @model_validator(mode='after')
     def validate_tourism_regime_update(self):
         """Validar que si se activa tourism_regime=True, debe tener fecha de vencimiento futura"""
-        if self.tourism_regime is True:  # Específicamente True, no None
-            if not self.tourism_regime_expiry:
-                raise ValueError("Si activa el régimen de turismo, debe proporcionar la fecha de vencimiento del régimen")
-            
-            # Verificar que la fecha de vencimiento no sea pasada
-            if self.tourism_regime_expiry <= date.today():
-                raise ValueError("La fecha de vencimiento del régimen de turismo debe ser futura")
-        
+        _require_future_tourism_expiry(
+            self.tourism_regime, self.tourism_regime_expiry,
+            "Si activa el régimen de turismo, debe proporcionar la fecha de vencimiento del régimen"
+        )
         return self
 
-class Customer(CustomerBase):
+class Customer(TrustedReadMixin, CustomerBase):
+    # El email ya fue validado al guardarse: no volver a validarlo en lectura
+    email: Optional[str] = Field(None, description="Email principal")
     id: int
     customer_code: str
     created_by_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
-    contacts: List[Contact] = []
+    contacts: List[Contact] = Field(default_factory=list)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class CustomerList(BaseModel):
+class CustomerList(TrustedReadMixin, BaseModel):
     id: int
     customer_code: str
     company_name: str
     contact_name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     phone: Optional[str] = None
     city: Optional[str] = None
     is_active: bool
     tourism_regime: bool = False  # Indicador visual de régimen de turismo
     created_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# Serializador reutilizable para respuestas de listas de clientes
+customer_list_adapter = TypeAdapter(List[CustomerList])
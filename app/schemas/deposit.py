@@ -1,10 +1,12 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 from decimal import Decimal
 from datetime import date, datetime
 from typing import Optional, List
-from enum import Enum
+from enum import StrEnum
 
-class DepositType(str, Enum):
+from app.schemas.base import TrustedReadMixin
+
+class DepositType(StrEnum):
     """Tipos de depósito específicos para Paraguay"""
     ADVANCE = "ANTICIPO"        # Anticipo sobre trabajo futuro
     EARNEST = "SEÑA"           # Seña para reservar producto/servicio
@@ -12,19 +14,19 @@ class DepositType(str, Enum):
     SECURITY = "CAUCION"        # Caución para contratos
     PARTIAL = "PARCIAL"         # Pago parcial a cuenta
 
-class DepositStatus(str, Enum):
+class DepositStatus(StrEnum):
     """Estados de depósito"""
     ACTIVE = "ACTIVO"           # Depósito disponible para aplicar
     APPLIED = "APLICADO"        # Depósito aplicado a facturas
     REFUNDED = "DEVUELTO"       # Depósito devuelto al cliente
     EXPIRED = "VENCIDO"         # Depósito vencido (si aplica)
 
-class Currency(str, Enum):
+class Currency(StrEnum):
     """Monedas soportadas en Paraguay"""
     PYG = "PYG"  # Guaraníes
     USD = "USD"  # Dólares
 
-class PaymentMethod(str, Enum):
+class PaymentMethod(StrEnum):
     """Métodos de pago para depósitos"""
     CASH = "CASH"
     TRANSFER = "TRANSFER"
@@ -46,11 +48,11 @@ class DepositBase(BaseModel):
     project_reference: Optional[str] = None
     contract_number: Optional[str] = None
 
-    @validator('expiry_date')
-    def validate_expiry_date(cls, v, values):
-        if v and 'deposit_date' in values and v <= values['deposit_date']:
+    @model_validator(mode='after')
+    def validate_expiry_date(self):
+        if self.expiry_date and self.expiry_date <= self.deposit_date:
             raise ValueError('Fecha de vencimiento debe ser posterior a la fecha del depósito')
-        return v
+        return self
 
 class DepositCreate(DepositBase):
     pass
@@ -65,7 +67,7 @@ class DepositUpdate(BaseModel):
     project_reference: Optional[str] = None
     contract_number: Optional[str] = None
 
-class Deposit(DepositBase):
+class Deposit(TrustedReadMixin, DepositBase):
     id: int
     deposit_number: str
     status: DepositStatus
@@ -78,10 +80,9 @@ class Deposit(DepositBase):
     # Información del cliente para mostrar
     customer_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class DepositList(BaseModel):
+class DepositList(TrustedReadMixin, BaseModel):
     """Schema para lista de depósitos"""
     id: int
     deposit_number: str
@@ -95,8 +96,10 @@ class DepositList(BaseModel):
     available_amount: Decimal
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Serializador reutilizable para respuestas de listas de depósitos
+deposit_list_adapter = TypeAdapter(List[DepositList])
 
 # Schemas para DepositApplication
 class DepositApplicationBase(BaseModel):
@@ -109,7 +112,7 @@ class DepositApplicationBase(BaseModel):
 class DepositApplicationCreate(DepositApplicationBase):
     pass
 
-class DepositApplication(DepositApplicationBase):
+class DepositApplication(TrustedReadMixin, DepositApplicationBase):
     id: int
     applied_by_id: int
     created_at: datetime
@@ -118,11 +121,10 @@ class DepositApplication(DepositApplicationBase):
     deposit_number: Optional[str] = None
     invoice_number: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para CustomerDepositSummary
-class CustomerDepositSummary(BaseModel):
+class CustomerDepositSummary(TrustedReadMixin, BaseModel):
     customer_id: int
     customer_name: Optional[str] = None
     
@@ -145,8 +147,7 @@ class CustomerDepositSummary(BaseModel):
     last_application_date: Optional[date] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para operaciones específicas
 class ApplyDepositToInvoice(BaseModel):
@@ -1,27 +1,35 @@
-from pydantic import BaseModel, validator, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from typing import Literal, Optional, List
 from decimal import Decimal
-from datetime import date, datetime
-from enum import Enum
+from datetime import date, datetime, timedelta
+from enum import StrEnum
 
-class InvoiceStatus(str, Enum):
+from app.schemas.base import TrustedReadMixin
+
+# Plazo por defecto para el vencimiento de facturas
+_THIRTY_DAYS = timedelta(days=30)
+
+# Valor por defecto compartido (Decimal es inmutable)
+_D0 = Decimal('0')
+
+class InvoiceStatus(StrEnum):
     PENDING = "PENDING"
     SENT = "SENT"
     PAID = "PAID"
     OVERDUE = "OVERDUE"
     CANCELLED = "CANCELLED"
 
-class PaymentMethod(str, Enum):
+class PaymentMethod(StrEnum):
     CASH = "CASH"
     TRANSFER = "TRANSFER"
     CHECK = "CHECK"
     CARD = "CARD"
 
-class CondicionVenta(str, Enum):
+class CondicionVenta(StrEnum):
     CONTADO = "CONTADO"
     CREDITO = "CREDITO"
 
-class IVACategory(str, Enum):
+class IVACategory(StrEnum):
     IVA_10 = "10"
     IVA_5 = "5"
     EXENTO = "EXENTO"
@@ -37,21 +45,20 @@ class PaymentCreate(PaymentBase):
     invoice_id: int
     payment_date: date
 
-class Payment(PaymentBase):
+class Payment(TrustedReadMixin, PaymentBase):
     id: int
     invoice_id: int
     payment_date: date
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Invoice Line schemas
 class InvoiceLineBase(BaseModel):
     product_id: int
     quantity: int = Field(..., gt=0, description="Cantidad debe ser mayor a 0")
     unit_price: Decimal = Field(..., ge=0, description="Precio unitario")
-    discount_percent: Decimal = Field(Decimal('0'), ge=0, le=100, description="Descuento entre 0 y 100%")
+    discount_percent: Decimal = Field(_D0, ge=0, le=100, description="Descuento entre 0 y 100%")
     description: Optional[str] = None
     
     # CAMPOS FISCALES PARA IVA PARAGUAYO
@@ -60,20 +67,26 @@ class InvoiceLineBase(BaseModel):
 class InvoiceLineCreate(InvoiceLineBase):
     pass
 
-class InvoiceLine(InvoiceLineBase):
+# Validador reutilizable para listas de líneas de factura
+_INVOICE_LINES_ADAPTER = TypeAdapter(List[InvoiceLineCreate])
+
+def validate_invoice_lines(raw_lines: list) -> List[InvoiceLineCreate]:
+    """Validar en una sola pasada una lista de líneas de factura (dicts u objetos)"""
+    return _INVOICE_LINES_ADAPTER.validate_python(raw_lines)
+
+class InvoiceLine(TrustedReadMixin, InvoiceLineBase):
     id: int
     invoice_id: int
     line_total: Decimal
     
     # CAMPOS FISCALES PARA IVA PARAGUAYO
-    iva_amount: Decimal = Decimal('0')
+    iva_amount: Decimal = _D0
     
     # Información del producto para mostrar
     product_name: Optional[str] = None
     product_code: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Invoice schemas
 class InvoiceBase(BaseModel):
@@ -89,7 +102,7 @@ class InvoiceBase(BaseModel):
 
 class InvoiceCreate(InvoiceBase):
     sales_order_id: Optional[int] = None
-    lines: List[InvoiceLineCreate] = []
+    lines: List[InvoiceLineCreate] = Field(default_factory=list)
 
 class InvoiceUpdate(BaseModel):
     status: Optional[InvoiceStatus] = None
@@ -97,7 +110,8 @@ class InvoiceUpdate(BaseModel):
     payment_terms: Optional[str] = None
     notes: Optional[str] = None
 
-class Invoice(InvoiceBase):
+class Invoice(TrustedReadMixin, InvoiceBase):
+    """Detalle completo de factura; los listados usan InvoiceList"""
     id: int
     invoice_number: str
     sales_order_id: Optional[int] = None
@@ -107,7 +121,7 @@ class Invoice(InvoiceBase):
     total_amount: Decimal
     paid_amount: Decimal
     balance_due: Decimal
-    currency: str = "PYG"
+    currency: Literal["PYG", "USD"] = "PYG"
     created_at: datetime
     updated_at: Optional[datetime] = None
     
@@ -115,15 +129,15 @@ class Invoice(InvoiceBase):
     punto_expedicion: Optional[str] = None
     
     # DESGLOSE DE IVA PARAGUAYO
-    subtotal_gravado_10: Decimal = Decimal('0')
-    subtotal_gravado_5: Decimal = Decimal('0')
-    subtotal_exento: Decimal = Decimal('0')
-    iva_10: Decimal = Decimal('0')
-    iva_5: Decimal = Decimal('0')
+    subtotal_gravado_10: Decimal = _D0
+    subtotal_gravado_5: Decimal = _D0
+    subtotal_exento: Decimal = _D0
+    iva_10: Decimal = _D0
+    iva_5: Decimal = _D0
     
     # RÉGIMEN DE TURISMO PARAGUAY
     tourism_regime_applied: bool = False
-    tourism_regime_percentage: Decimal = Decimal('0')
+    tourism_regime_percentage: Decimal = _D0
     
     # Información del cliente para mostrar
     customer_name: Optional[str] = None
@@ -133,15 +147,14 @@ class Invoice(InvoiceBase):
     # Información de la orden de venta
     sales_order_number: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InvoiceWithDetails(Invoice):
-    lines: List[InvoiceLine] = []
-    payments: List[Payment] = []
+    lines: List[InvoiceLine] = Field(default_factory=list)
+    payments: List[Payment] = Field(default_factory=list)
 
 # Schemas para listas
-class InvoiceList(BaseModel):
+class InvoiceList(TrustedReadMixin, BaseModel):
     id: int
     invoice_number: str
     customer_id: int
@@ -152,6 +165,11 @@ class InvoiceList(BaseModel):
     total_amount: Decimal
     balance_due: Decimal
     created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# Serializador reutilizable para respuestas de listas de facturas
+invoice_list_adapter = TypeAdapter(List[InvoiceList])
 
 class InvoiceSummary(BaseModel):
     total_invoices: int
@@ -168,41 +186,23 @@ class InvoiceFromOrder(BaseModel):
     payment_terms: Optional[str] = "Net 30"
     notes: Optional[str] = None
     
-    @validator('invoice_date', pre=True, always=True)
-    def set_invoice_date(cls, v):
-        return v or date.today()
-    
-    @validator('due_date', pre=True, always=True)
-    def set_due_date(cls, v, values):
-        if v:
-            return v
+    @model_validator(mode='after')
+    def set_default_dates(self):
+        self.invoice_date = self.invoice_date or date.today()
         # Si no se especifica, usar 30 días desde la fecha de factura
-        from datetime import timedelta
-        invoice_date = values.get('invoice_date', date.today())
-        return invoice_date + timedelta(days=30) if invoice_date else None
+        self.due_date = self.due_date or (self.invoice_date + _THIRTY_DAYS)
+        return self
+
+# Tablas de búsqueda precalculadas para parsear estados y métodos de pago
+_STATUS_MAP = {status.value: status for status in InvoiceStatus}
+_METHOD_MAP = {method.value: method for method in PaymentMethod}
 
 def parse_invoice_status(status_str: str) -> InvoiceStatus:
     """Convertir string a enum de estado de factura, manejando case insensitive"""
-    if not status_str:
-        return InvoiceStatus.PENDING
-    
-    status_upper = status_str.upper().strip()
-    
-    try:
-        return InvoiceStatus(status_upper)
-    except ValueError:
-        # Si no es un estado válido, devolver PENDING por defecto
-        return InvoiceStatus.PENDING
+    # Si no es un estado válido, devolver PENDING por defecto
+    return _STATUS_MAP.get((status_str or "").upper().strip(), InvoiceStatus.PENDING)
 
 def parse_payment_method(method_str: str) -> PaymentMethod:
     """Convertir string a enum de método de pago, manejando case insensitive"""
-    if not method_str:
-        return PaymentMethod.CASH
-    
-    method_upper = method_str.upper().strip()
-    
-    try:
-        return PaymentMethod(method_upper)
-    except ValueError:
-        # Si no es un método válido, devolver CASH por defecto
-        return PaymentMethod.CASH
\ No newline at end of file
+    # Si no es un método válido, devolver CASH por defecto
+    return _METHOD_MAP.get((method_str or "").upper().strip(), PaymentMethod.CASH)
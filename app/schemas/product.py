@@ -1,13 +1,25 @@
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
 from enum import Enum
 
+from app.schemas.base import ZERO, TrustedReadMixin, enum_lookup
+
 class CurrencyEnum(str, Enum):
     PYG = "PYG"
     USD = "USD"
 
+def _none_to_true(v):
+    # Convert None to True (default value)
+    return True if v is None else v
+
+# Bandera booleana que interpreta None (columna sin valor) como True
+DefaultTrueBool = Annotated[bool, BeforeValidator(_none_to_true)]
+
+# Moneda de lectura resuelta con una tabla precalculada; None (columna sin valor) se interpreta como PYG
+CurrencyValue = Annotated[CurrencyEnum, enum_lookup(CurrencyEnum, {None: CurrencyEnum.PYG})]
+
 # Schemas para ProductCategory
 class ProductCategoryBase(BaseModel):
     name: str = Field(..., description="Nombre de la categoría")
@@ -25,17 +37,9 @@ class ProductCategoryUpdate(BaseModel):
 class ProductCategory(ProductCategoryBase):
     id: int
     created_at: datetime
+    is_active: DefaultTrueBool = Field(True, description="Categoría activa")
     
-    @field_validator('is_active', mode='before')
-    @classmethod
-    def validate_is_active(cls, v):
-        # Convert None to True (default value)
-        if v is None:
-            return True
-        return v
-    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para Product
 class ProductBase(BaseModel):
@@ -43,7 +47,7 @@ class ProductBase(BaseModel):
     description: Optional[str] = Field(None, description="Descripción del producto")
     category_id: Optional[int] = Field(None, description="ID de la categoría")
     unit_of_measure: str = Field("PZA", description="Unidad de medida")
-    cost_price: Decimal = Field(Decimal("0.00"), ge=0, description="Precio de costo")
+    cost_price: Decimal = Field(ZERO, ge=0, description="Precio de costo")
     selling_price: Decimal = Field(..., ge=0, description="Precio de venta")
     min_stock_level: int = Field(0, ge=0, description="Nivel mínimo de stock")
     max_stock_level: int = Field(0, ge=0, description="Nivel máximo de stock")
@@ -80,31 +84,16 @@ class Product(ProductBase):
     product_code: str
     current_stock: int
     expiry_date: Optional[date] = None
-    currency: CurrencyEnum
+    currency: CurrencyValue
     created_at: datetime
     updated_at: Optional[datetime] = None
     category_name: Optional[str] = None
+    is_active: DefaultTrueBool = Field(True, description="Producto activo")
+    is_trackable: DefaultTrueBool = Field(True, description="Maneja inventario")
     
-    @field_validator('is_active', mode='before')
-    @classmethod
-    def validate_is_active(cls, v):
-        # Convert None to True (default value)
-        if v is None:
-            return True
-        return v
-    
-    @field_validator('is_trackable', mode='before')
-    @classmethod
-    def validate_is_trackable(cls, v):
-        # Convert None to True (default value)
-        if v is None:
-            return True
-        return v
-    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class ProductList(BaseModel):
+class ProductList(TrustedReadMixin, BaseModel):
     id: int
     product_code: str
     name: str
@@ -113,27 +102,13 @@ class ProductList(BaseModel):
     current_stock: int
     is_active: bool
     is_trackable: bool
-    currency: CurrencyEnum
+    currency: CurrencyValue
     expiry_date: Optional[date] = None
     
-    @field_validator('is_active', mode='before')
-    @classmethod
-    def validate_is_active(cls, v):
-        # Convert None to True (default value)
-        if v is None:
-            return True
-        return v
-    
-    @field_validator('is_trackable', mode='before')
-    @classmethod
-    def validate_is_trackable(cls, v):
-        # Convert None to True (default value)
-        if v is None:
-            return True
-        return v
-    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Serializador reutilizable para respuestas de listas de productos
+product_list_adapter = TypeAdapter(List[ProductList])
 
 # Schemas para StockMovement
 class StockMovementBase(BaseModel):
@@ -153,8 +128,7 @@ class StockMovement(StockMovementBase):
     created_at: datetime
     product_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class StockAdjustment(BaseModel):
     product_id: int = Field(..., description="ID del producto")
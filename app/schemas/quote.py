@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.base import LineItemBase, LineItemUpdate, TrustedReadMixin, enum_lookup
 
 # Enums
 class QuoteStatus(str, Enum):
@@ -12,6 +14,15 @@ class QuoteStatus(str, Enum):
     rejected = "REJECTED"
     expired = "EXPIRED"
 
+# Tabla de búsqueda precalculada de valor -> estado
+_QUOTE_STATUS_BY_VALUE = {status.value: status for status in QuoteStatus}
+
+# Estado resuelto con la misma tabla, aceptando también los valores legacy en minúsculas
+QuoteStatusValue = Annotated[
+    QuoteStatus,
+    enum_lookup(QuoteStatus, {status.value.lower(): status for status in QuoteStatus})
+]
+
 def parse_quote_status(status_str: str) -> QuoteStatus:
     """
     Helper function to parse quote status case-insensitively.
@@ -20,42 +31,29 @@ def parse_quote_status(status_str: str) -> QuoteStatus:
     if not status_str:
         return QuoteStatus.draft
     
-    # Convert to uppercase and try to match
-    status_upper = status_str.upper()
-    
-    # Map to enum values
-    for status in QuoteStatus:
-        if status.value == status_upper:
-            return status
-    
-    # Fallback for unknown values
-    raise ValueError(f"Unknown quote status: {status_str}")
+    # Convert to uppercase and look up the enum value
+    status = _QUOTE_STATUS_BY_VALUE.get(status_str.upper())
+    if status is None:
+        # Fallback for unknown values
+        raise ValueError(f"Unknown quote status: {status_str}")
+    return status
 
 # Schemas para QuoteLine
-class QuoteLineBase(BaseModel):
-    product_id: int = Field(..., description="ID del producto")
-    quantity: int = Field(..., gt=0, description="Cantidad")
-    unit_price: Decimal = Field(..., ge=0, description="Precio unitario")
-    discount_percent: Decimal = Field(Decimal("0.00"), ge=0, le=100, description="Descuento en porcentaje")
-    description: Optional[str] = Field(None, description="Descripción del artículo")
+class QuoteLineBase(LineItemBase):
+    pass
 
 class QuoteLineCreate(QuoteLineBase):
     pass
 
-class QuoteLineUpdate(BaseModel):
-    product_id: Optional[int] = None
-    quantity: Optional[int] = None
-    unit_price: Optional[Decimal] = None
-    discount_percent: Optional[Decimal] = None
-    description: Optional[str] = None
+class QuoteLineUpdate(LineItemUpdate):
+    pass
 
 class QuoteLine(QuoteLineBase):
     id: int
     quote_id: int
     line_total: Decimal = Field(..., description="Total de la línea")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para Quote
 class QuoteBase(BaseModel):
@@ -80,35 +78,36 @@ class QuoteUpdate(BaseModel):
 class Quote(QuoteBase):
     id: int
     quote_number: str
-    status: QuoteStatus
+    status: QuoteStatusValue
     subtotal: Decimal
     tax_amount: Decimal
     total_amount: Decimal
     created_by_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
-    lines: List[QuoteLine] = []
+    lines: List[QuoteLine] = Field(default_factory=list)
     
     # Información del cliente (para mostrar en listados)
     customer_name: Optional[str] = None
     customer_email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class QuoteList(BaseModel):
+class QuoteList(TrustedReadMixin, BaseModel):
     id: int
     quote_number: str
     customer_id: int
     customer_name: str
     quote_date: date
     valid_until: date
-    status: QuoteStatus
+    status: QuoteStatusValue
     total_amount: Decimal
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Serializador reutilizable para respuestas de listas de cotizaciones
+quote_list_adapter = TypeAdapter(List[QuoteList])
 
 class QuotePDFResponse(BaseModel):
     quote_id: int
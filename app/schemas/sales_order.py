@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.base import ZERO, LineItemBase, LineItemUpdate, TrustedReadMixin, enum_lookup
 
 # Enums
 class SalesOrderStatus(str, Enum):
@@ -12,23 +14,21 @@ class SalesOrderStatus(str, Enum):
     delivered = "DELIVERED"
     cancelled = "CANCELLED"
 
+# Estado resuelto con una tabla precalculada, aceptando también valores en minúsculas
+SalesOrderStatusValue = Annotated[
+    SalesOrderStatus,
+    enum_lookup(SalesOrderStatus, {status.value.lower(): status for status in SalesOrderStatus})
+]
+
 # Schemas para SalesOrderLine
-class SalesOrderLineBase(BaseModel):
-    product_id: int = Field(..., description="ID del producto")
-    quantity: int = Field(..., gt=0, description="Cantidad")
-    unit_price: Decimal = Field(..., ge=0, description="Precio unitario")
-    discount_percent: Decimal = Field(Decimal("0.00"), ge=0, le=100, description="Descuento en porcentaje")
-    description: Optional[str] = Field(None, description="Descripción del artículo")
+class SalesOrderLineBase(LineItemBase):
+    pass
 
 class SalesOrderLineCreate(SalesOrderLineBase):
     pass
 
-class SalesOrderLineUpdate(BaseModel):
-    product_id: Optional[int] = None
-    quantity: Optional[int] = None
-    unit_price: Optional[Decimal] = None
-    discount_percent: Optional[Decimal] = None
-    description: Optional[str] = None
+class SalesOrderLineUpdate(LineItemUpdate):
+    pass
 
 class SalesOrderLine(SalesOrderLineBase):
     id: int
@@ -37,15 +37,14 @@ class SalesOrderLine(SalesOrderLineBase):
     quantity_shipped: int = Field(0, description="Cantidad enviada")
     quantity_invoiced: int = Field(0, description="Cantidad facturada")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schemas para SalesOrder
 class SalesOrderBase(BaseModel):
     customer_id: int = Field(..., description="ID del cliente")
     order_date: date = Field(..., description="Fecha de la orden")
     delivery_date: Optional[date] = Field(None, description="Fecha de entrega esperada")
-    shipping_cost: Decimal = Field(Decimal("0.00"), ge=0, description="Costo de envío")
+    shipping_cost: Decimal = Field(ZERO, ge=0, description="Costo de envío")
     shipping_address: Optional[str] = Field(None, description="Dirección de envío")
     notes: Optional[str] = Field(None, description="Notas adicionales")
 
@@ -67,35 +66,39 @@ class SalesOrder(SalesOrderBase):
     id: int
     order_number: str
     quote_id: Optional[int] = None
-    status: SalesOrderStatus
+    status: SalesOrderStatusValue
     subtotal: Decimal
     tax_amount: Decimal
     total_amount: Decimal
     created_by_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
-    lines: List[SalesOrderLine] = []
+    lines: List[SalesOrderLine] = Field(default_factory=list)
     
     # Información del cliente
     customer_name: Optional[str] = None
     customer_email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class SalesOrderList(BaseModel):
+class SalesOrderList(TrustedReadMixin, BaseModel):
     id: int
     order_number: str
     customer_id: int
     customer_name: str
     order_date: date
     delivery_date: Optional[date] = None
-    status: SalesOrderStatus
+    status: SalesOrderStatusValue
     total_amount: Decimal
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Serializador reutilizable para respuestas de listas de órdenes de venta
+sales_order_list_adapter = TypeAdapter(List[SalesOrderList])
+
+# Tabla de búsqueda precalculada de valor -> estado
+_SO_STATUS_BY_VALUE = {status.value: status for status in SalesOrderStatus}
 
 # Helper function similar to quote status
 def parse_sales_order_status(status_value) -> SalesOrderStatus:
@@ -105,11 +108,7 @@ def parse_sales_order_status(status_value) -> SalesOrderStatus:
     if not status_value:
         return SalesOrderStatus.pending
     
-    status_str = str(status_value).strip().upper()
-    try:
-        return SalesOrderStatus(status_str)
-    except ValueError:
-        # Handle legacy or unknown values
-        if status_str in ["DRAFT", "NEW"]:
-            return SalesOrderStatus.pending
-        return SalesOrderStatus.pending
\ No newline at end of file
+    if not isinstance(status_value, str):
+        status_value = str(status_value)
+    # Legacy or unknown values (DRAFT, NEW, ...) map to pending
+    return _SO_STATUS_BY_VALUE.get(status_value.strip().upper(), SalesOrderStatus.pending)
\ No newline at end of file
@@ -1,11 +1,11 @@
 import logging
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import Iterable, NamedTuple
 from celery import current_task
 from sqlalchemy.orm import Session
 
 from app.core.celery_app import celery_app
-from app.core.database import get_database
+from app.core.database import session_scope
 from app.models import Customer  # Import from models module to ensure all models are registered
 from app.core.config import settings
 
@@ -13,46 +13,43 @@ from app.core.config import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ExpiringCustomer(NamedTuple):
+    """Datos mínimos de un cliente con régimen de turismo próximo a vencer"""
+    id: int
+    company_name: str
+    contact_name: str
+    tourism_regime_expiry: date
+    days_until: int
+
 class NotificationService:
     """Servicio para gestionar notificaciones del sistema"""
     
     @staticmethod
-    def get_customers_with_expiring_tourism(db: Session, days_ahead: int = 5) -> List[Customer]:
+    def get_customers_with_expiring_tourism(db: Session, days_ahead: int = 5) -> Iterable[ExpiringCustomer]:
         """
         Obtiene clientes cuyo régimen de turismo vence en los próximos X días
+        Solo se consultan las columnas de ExpiringCustomer, con los días restantes
+        calculados en la base de datos. Las filas se leen por lotes a medida que
+        se recorren, sin cargar todo el resultado en memoria.
         """
-        future_date = datetime.now().date() + timedelta(days=days_ahead)
+        # La fecha de referencia es la del servidor de la aplicación, no la de la base de datos
+        today = datetime.now().date()
+        future_date = today + timedelta(days=days_ahead)
         
-        return db.query(Customer).filter(
+        rows = db.query(
+            Customer.id,
+            Customer.company_name,
+            Customer.contact_name,
+            Customer.tourism_regime_expiry,
+            (Customer.tourism_regime_expiry - today).label("days_until")
+        ).filter(
             Customer.tourism_regime == True,
             Customer.tourism_regime_expiry.isnot(None),
             Customer.tourism_regime_expiry <= future_date,
-            Customer.tourism_regime_expiry >= datetime.now().date()
-        ).all()
-    
-    @staticmethod
-    def send_notification(customer: Customer, days_until_expiry: int) -> bool:
-        """
-        Envía notificación sobre vencimiento de régimen de turismo
-        Por ahora registra en logs - puede expandirse a email/SMS
-        """
-        try:
-            message = (
-                f"AVISO: Régimen de turismo del cliente '{customer.company_name}' "
-                f"(ID: {customer.id}) vence en {days_until_expiry} días "
-                f"(Fecha vencimiento: {customer.tourism_regime_expiry})"
-            )
-            
-            logger.warning(f"🚨 NOTIFICACIÓN TURISMO: {message}")
-            
-            # Aquí se puede expandir para enviar email
-            # send_email_notification(customer, message)
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error enviando notificación para cliente {customer.id}: {str(e)}")
-            return False
+            Customer.tourism_regime_expiry >= today
+        ).yield_per(500)
+        
+        return map(ExpiringCustomer._make, rows)
     
     @staticmethod
     def process_expiry_notifications(db: Session) -> dict:
@@ -70,29 +67,40 @@ class NotificationService:
             # Buscar clientes con régimen próximo a vencer (5 días)
             expiring_customers = NotificationService.get_customers_with_expiring_tourism(db, days_ahead=5)
             
+            notified = result["customers_notified"]
             for customer in expiring_customers:
                 result["processed"] += 1
-                
-                # Calcular días hasta vencimiento
-                days_until = (customer.tourism_regime_expiry - datetime.now().date()).days
-                
-                # Enviar notificación
-                if NotificationService.send_notification(customer, days_until):
-                    result["notifications_sent"] += 1
-                    result["customers_notified"].append({
-                        "id": customer.id,
-                        "company_name": customer.company_name,
-                        "expiry_date": customer.tourism_regime_expiry.isoformat(),
-                        "days_until": days_until
-                    })
-                else:
-                    result["errors"] += 1
+                notified.append({
+                    "id": customer.id,
+                    "company_name": customer.company_name,
+                    # La fecha se serializa junto con todo el resultado (FastAPI/Celery)
+                    "expiry_date": customer.tourism_regime_expiry,
+                    # Días hasta vencimiento, calculados en la consulta
+                    "days_until": customer.days_until
+                })
+            
+            # Un solo aviso en el log para todo el lote; solo cuenta como enviado
+            # si el aviso realmente se emitió
+            if notified and logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "🚨 NOTIFICACIÓN TURISMO: %d clientes con régimen de turismo próximo a vencer:\n%s",
+                    len(notified),
+                    "\n".join(
+                        f"AVISO: '{c['company_name']}' (ID: {c['id']}) vence en {c['days_until']} días "
+                        f"(Fecha vencimiento: {c['expiry_date']})"
+                        for c in notified
+                    )
+                )
+                result["notifications_sent"] = len(notified)
             
-            logger.info(f"Procesamiento completado: {result}")
+            logger.info(
+                "Procesamiento completado: %d procesados, %d enviados, %d errores",
+                result["processed"], result["notifications_sent"], result["errors"]
+            )
             return result
             
         except Exception as e:
-            logger.error(f"Error en proceso de notificaciones: {str(e)}")
+            logger.error("Error en proceso de notificaciones: %s", e)
             result["errors"] += 1
             return result
 
@@ -104,29 +112,23 @@ def check_tourism_expiry_task():
     """
     logger.info("🔍 Iniciando verificación de vencimientos de régimen de turismo...")
     
-    db = None
     try:
-        # Obtener sesión de base de datos
-        db_generator = get_database()
-        db = next(db_generator)
-        
-        # Procesar notificaciones
-        result = NotificationService.process_expiry_notifications(db)
+        # La sesión se cierra al salir del bloque
+        with session_scope() as db:
+            # Procesar notificaciones
+            result = NotificationService.process_expiry_notifications(db)
         
-        logger.info(f"✅ Verificación completada: {result}")
+        # Solo conteos en INFO; el detalle de clientes notificados queda en DEBUG
+        logger.info(
+            "✅ Verificación completada: %d procesados, %d enviados, %d errores",
+            result["processed"], result["notifications_sent"], result["errors"]
+        )
+        logger.debug("Detalle de la verificación: %s", result)
         return result
         
     except Exception as e:
-        error_msg = f"❌ Error en task de verificación: {str(e)}"
-        logger.error(error_msg)
+        logger.error("❌ Error en task de verificación: %s", e)
         raise e
-    
-    finally:
-        try:
-            if db is not None:
-                db.close()
-        except:
-            pass
 
 # Función para trigger manual (testing/debug)
 def trigger_expiry_check_manually():
@@ -1,5 +1,7 @@
-import os
 import io
+from collections import OrderedDict
+from copy import copy
+from functools import lru_cache
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
@@ -18,38 +20,212 @@ from app.core.database import get_database
 from app.utils.paraguay_fiscal import ParaguayFiscalUtils, ParaguayFiscalValidator
 from app.crud.company import company_settings_crud
 
+# Estilos compartidos: se construyen una sola vez al importar el módulo
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.darkblue,
+    spaceAfter=30,
+    alignment=1  # Center alignment
+)
+_HEADER_STYLE = ParagraphStyle(
+    'CustomHeader',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.darkblue,
+    spaceAfter=12
+)
+_NORMAL_STYLE = _STYLES['Normal']
+
+# Títulos y encabezados de sección con texto fijo: el marcado se parsea una sola vez y cada PDF
+# usa una copia, porque los flowables guardan estado de maquetación al construirse
+_TITLE_COTIZACION = Paragraph("COTIZACIÓN", _TITLE_STYLE)
+_TITLE_FACTURA = Paragraph("FACTURA", _TITLE_STYLE)
+_DETALLE_HEADER = Paragraph("Detalle de Productos/Servicios", _HEADER_STYLE)
+_TERMINOS_HEADER = Paragraph("Términos y Condiciones", _HEADER_STYLE)
+_NOTAS_HEADER = Paragraph("Notas Adicionales", _HEADER_STYLE)
+_TERMINOS_PAGO_HEADER = Paragraph("Términos de Pago", _HEADER_STYLE)
+
+# Estilos y anchos de columna de las tablas: son invariables entre PDFs
+_COMPANY_COLWIDTHS = (3*inch, 3*inch)
+_COMPANY_HEADER_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (0, 0), 14),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+# Tablas de datos del documento y del cliente (etiqueta: valor)
+_INFO_COLWIDTHS = (1.5*inch, 2*inch)
+_INFO_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+_INFO_MAIN_COLWIDTHS = (3.5*inch, 3.5*inch)
+_INFO_MAIN_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+# Tabla de productos/servicios (cotizaciones y facturas)
+_ITEMS_HEADERS = ("Descripción", "Cantidad", "Precio Unit.", "Descuento", "Total")
+_ITEMS_COLWIDTHS = (2.5*inch, 0.8*inch, 1*inch, 0.8*inch, 1*inch)
+_ITEMS_TABLE_STYLE = TableStyle([
+    # Encabezados
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    
+    # Datos
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),  # Alineación derecha para números
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),   # Alineación izquierda para descripción
+    
+    # Bordes
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    
+    # Alternar colores de filas
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+])
+
+# Totales de cotización
+_TOTALS_COLWIDTHS = (1.5*inch, 1.5*inch)
+_TOTALS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 1), 10),
+    ('FONTSIZE', (0, 2), (-1, 2), 12),  # Total más grande
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, 2), (-1, 2), colors.lightblue),  # Resaltar total
+])
+_TOTALS_MAIN_COLWIDTHS = (4.5*inch, 3*inch)
+
+# Totales de factura (formato simple)
+_INVOICE_TOTALS_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 3), 10),
+    ('FONTSIZE', (0, 2), (0, 2), 12),  # Total más grande
+    ('FONTSIZE', (0, 4), (0, 4), 11),  # Saldo pendiente destacado
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, 2), (-1, 2), colors.lightblue),  # Resaltar total
+    ('BACKGROUND', (0, 4), (-1, 4), colors.lightyellow),  # Resaltar saldo
+])
+
+# Totales de factura con desglose paraguayo e información fiscal
+_PY_TOTALS_COLWIDTHS = (2*inch, 1.5*inch)
+_PY_TOTALS_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -3), 9),
+    ('FONTSIZE', (0, -3), (0, -3), 11),  # Total más grande
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, -3), (-1, -3), colors.lightblue),  # Resaltar total
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightyellow),  # Resaltar saldo
+])
+_FISCAL_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+_PY_TOTALS_MAIN_COLWIDTHS = (3.5*inch, 3.5*inch)
+
+# Formateadores de montos y porcentajes ya enlazados (sin reparsear el formato)
+_FMT_MONEY = "${:,.2f}".format
+_FMT_PERCENT = "{}%".format
+
+def _item_rows(lines):
+    """Filas formateadas de la tabla de productos.
+
+    Extrae las columnas en una sola pasada y formatea cada columna completa
+    con ``map`` en lugar de armar fila por fila.
+    """
+    if not lines:
+        return []
+    descriptions, quantities, prices, discounts, totals = zip(*(
+        (
+            line.description or (line.product.name if line.product else "Producto"),
+            line.quantity,
+            line.unit_price,
+            line.discount_percent,
+            line.line_total,
+        )
+        for line in lines
+    ))
+    return list(zip(
+        descriptions,
+        map(str, quantities),
+        map(_FMT_MONEY, prices),
+        map(_FMT_PERCENT, discounts),
+        map(_FMT_MONEY, totals),
+    ))
+
+def _build_items_table(lines):
+    """Sección de productos/servicios (cotizaciones y facturas)"""
+    # Datos de los productos (la primera fila son los encabezados)
+    data = [_ITEMS_HEADERS, *_item_rows(lines)]
+    
+    items_table = Table(data, colWidths=_ITEMS_COLWIDTHS)
+    items_table.setStyle(_ITEMS_TABLE_STYLE)
+    
+    return [copy(_DETALLE_HEADER), items_table]
+
+def _build_totals_table(totals_data, style):
+    """Tabla de totales (etiqueta: monto) alineada a la derecha"""
+    totals_table = Table(totals_data, colWidths=_TOTALS_COLWIDTHS)
+    totals_table.setStyle(style)
+    
+    # Tabla para alinear a la derecha
+    main_table = Table([[" ", totals_table]], colWidths=_TOTALS_MAIN_COLWIDTHS)
+    
+    return [main_table]
+
+# Cantidad de PDFs de factura que se mantienen en memoria
+INVOICE_PDF_CACHE_SIZE = 128
+
+@lru_cache(maxsize=256)
+def _parsed_paragraph(text: str) -> Paragraph:
+    """Prototipo de párrafo con el texto ya parseado (no se agrega a ningún story).
+
+    Los términos y notas suelen repetirse entre documentos; así el parser XML
+    de ReportLab corre una sola vez por texto distinto.
+    """
+    return Paragraph(text, _NORMAL_STYLE)
+
+def _normal_paragraph(text: str) -> Paragraph:
+    """Párrafo de estilo normal listo para agregar al story"""
+    return copy(_parsed_paragraph(text))
+
 class PDFGenerator:
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            textColor=colors.darkblue,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        self.header_style = ParagraphStyle(
-            'CustomHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.darkblue,
-            spaceAfter=12
-        )
+        self.styles = _STYLES
+        self.title_style = _TITLE_STYLE
+        self.header_style = _HEADER_STYLE
+        self.normal_style = _NORMAL_STYLE
+        # PDFs de factura ya generados (LRU): clave -> bytes
+        self._invoice_pdf_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
 
-    def generate_quote_pdf(self, quote: Quote, output_dir: str = "temp/pdfs") -> str:
-        """Generar PDF de cotización"""
-        
-        # Crear directorio si no existe
-        os.makedirs(output_dir, exist_ok=True)
+    def generate_quote_pdf(self, quote: Quote) -> io.BytesIO:
+        """Generar PDF de cotización y devolver como BytesIO buffer"""
         
-        # Nombre del archivo
-        filename = f"cotizacion_{quote.quote_number}.pdf"
-        filepath = os.path.join(output_dir, filename)
+        # Crear buffer en memoria
+        buffer = io.BytesIO()
         
         # Crear documento PDF
         doc = SimpleDocTemplate(
-            filepath,
+            buffer,
             pagesize=letter,
             topMargin=0.5*inch,
             bottomMargin=0.5*inch,
@@ -57,71 +233,61 @@ class PDFGenerator:
             rightMargin=0.5*inch
         )
         
-        # Construir contenido
-        story = []
-        
-        # Encabezado de empresa
-        story.extend(self._create_company_header())
-        story.append(Spacer(1, 20))
-        
-        # Título
-        title = Paragraph("COTIZACIÓN", self.title_style)
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        # Información de cotización y cliente
-        story.extend(self._create_quote_info(quote))
-        story.append(Spacer(1, 20))
-        
-        # Tabla de productos/servicios
-        story.extend(self._create_items_table(quote))
-        story.append(Spacer(1, 20))
-        
-        # Totales
-        story.extend(self._create_totals_table(quote))
-        story.append(Spacer(1, 20))
-        
-        # Términos y condiciones
-        if quote.terms_conditions:
-            story.extend(self._create_terms_section(quote.terms_conditions))
-        
-        # Notas adicionales
-        if quote.notes:
-            story.extend(self._create_notes_section(quote.notes))
-        
-        # Pie de página
-        story.extend(self._create_footer())
+        # Construir contenido en una sola lista
+        story = [
+            # Encabezado de empresa
+            *self._create_company_header(),
+            Spacer(1, 20),
+            
+            # Título
+            copy(_TITLE_COTIZACION),
+            Spacer(1, 20),
+            
+            # Información de cotización y cliente
+            *self._create_quote_info(quote),
+            Spacer(1, 20),
+            
+            # Tabla de productos/servicios
+            *self._create_items_table(quote),
+            Spacer(1, 20),
+            
+            # Totales
+            *self._create_totals_table(quote),
+            Spacer(1, 20),
+            
+            # Términos y condiciones
+            *(self._create_terms_section(quote.terms_conditions) if quote.terms_conditions else ()),
+            
+            # Notas adicionales
+            *(self._create_notes_section(quote.notes) if quote.notes else ()),
+            
+            # Pie de página
+            *self._create_footer(),
+        ]
         
         # Construir PDF
         doc.build(story)
         
-        return filepath
+        return buffer
 
-    def _create_company_header(self, db: Session = None):
-        """Crear encabezado de empresa con datos paraguayos"""
-        # Obtener configuración de empresa desde la base de datos
-        company_settings = None
+    def _get_company(self, db: Session = None):
+        """Obtener datos de la empresa (cacheados por el CRUD, no consulta la base en cada PDF)"""
         if db:
             try:
-                company_settings = company_settings_crud.get_settings(db)
+                return company_settings_crud.get_snapshot(db)
             except:
                 pass
-        
-        if company_settings:
-            # Header con datos reales de la empresa paraguaya - obtener valores actuales
-            razon_social_val = getattr(company_settings, 'razon_social', '') or ''
-            ruc_val = getattr(company_settings, 'ruc', '') or ''
-            direccion_val = getattr(company_settings, 'direccion', '') or ''
-            telefono_val = getattr(company_settings, 'telefono', '') or ''
-            email_val = getattr(company_settings, 'email', '') or ''
-            timbrado_val = getattr(company_settings, 'timbrado', '') or ''
-            punto_expedicion_val = getattr(company_settings, 'punto_expedicion', '') or ''
-            
+        return None
+
+    def _create_company_header(self, company=None):
+        """Crear encabezado de empresa con datos paraguayos (``company``: snapshot del CRUD)"""
+        if company:
+            # Header con datos reales de la empresa paraguaya
             company_data = [
-                [razon_social_val, ""],
-                [f"RUC: {ruc_val}", f"Tel: {telefono_val}"],
-                [direccion_val, f"Email: {email_val}"],
-                [f"Timbrado: {timbrado_val}", f"Punto Exp.: {punto_expedicion_val}"]
+                [company.razon_social, ""],
+                [f"RUC: {company.ruc}", f"Tel: {company.telefono}"],
+                [company.direccion, f"Email: {company.email}"],
+                [f"Timbrado: {company.timbrado}", f"Punto Exp.: {company.punto_expedicion}"]
             ]
         else:
             # Fallback si no hay configuración
@@ -132,14 +298,8 @@ class PDFGenerator:
                 ["Timbrado: 12345678", "Punto Exp.: 001"]
             ]
         
-        company_table = Table(company_data, colWidths=[3*inch, 3*inch])
-        company_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (0, 0), 14),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        company_table = Table(company_data, colWidths=_COMPANY_COLWIDTHS)
+        company_table.setStyle(_COMPANY_HEADER_STYLE)
         
         return [company_table, HRFlowable(width="100%", thickness=1, color=colors.darkblue)]
 
@@ -153,13 +313,8 @@ class PDFGenerator:
             ["Estado:", quote.status.upper()]
         ]
         
-        quote_table = Table(quote_data, colWidths=[1.5*inch, 2*inch])
-        quote_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        quote_table = Table(quote_data, colWidths=_INFO_COLWIDTHS)
+        quote_table.setStyle(_INFO_TABLE_STYLE)
         
         # Información del cliente
         customer = quote.customer
@@ -170,115 +325,84 @@ class PDFGenerator:
             ["Teléfono:", customer.phone or ""]
         ]
         
-        customer_table = Table(customer_data, colWidths=[1.5*inch, 2*inch])
-        customer_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        customer_table = Table(customer_data, colWidths=_INFO_COLWIDTHS)
+        customer_table.setStyle(_INFO_TABLE_STYLE)
         
         # Tabla combinada
-        main_table = Table([[quote_table, customer_table]], colWidths=[3.5*inch, 3.5*inch])
-        main_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        main_table = Table([[quote_table, customer_table]], colWidths=_INFO_MAIN_COLWIDTHS)
+        main_table.setStyle(_INFO_MAIN_STYLE)
         
         return [main_table]
 
     def _create_items_table(self, quote: Quote):
         """Crear tabla de productos/servicios"""
-        # Encabezados
-        headers = ["Descripción", "Cantidad", "Precio Unit.", "Descuento", "Total"]
-        
-        # Datos de los productos
-        data = [headers]
-        
-        for line in quote.lines:
-            product_name = line.product.name if line.product else "Producto"
-            description = line.description or product_name
-            
-            row = [
-                description,
-                str(line.quantity),
-                f"${line.unit_price:,.2f}",
-                f"{line.discount_percent}%",
-                f"${line.line_total:,.2f}"
-            ]
-            data.append(row)
-        
-        # Crear tabla
-        items_table = Table(data, colWidths=[2.5*inch, 0.8*inch, 1*inch, 0.8*inch, 1*inch])
-        items_table.setStyle(TableStyle([
-            # Encabezados
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            
-            # Datos
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),  # Alineación derecha para números
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),   # Alineación izquierda para descripción
-            
-            # Bordes
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Alternar colores de filas
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        
-        return [Paragraph("Detalle de Productos/Servicios", self.header_style), items_table]
+        return _build_items_table(quote.lines)
 
     def _create_totals_table(self, quote: Quote):
         """Crear tabla de totales"""
         totals_data = [
-            ["Subtotal:", f"${quote.subtotal:,.2f}"],
-            ["IVA (16%):", f"${quote.tax_amount:,.2f}"],
-            ["TOTAL:", f"${quote.total_amount:,.2f}"]
+            ["Subtotal:", _FMT_MONEY(quote.subtotal)],
+            ["IVA (16%):", _FMT_MONEY(quote.tax_amount)],
+            ["TOTAL:", _FMT_MONEY(quote.total_amount)]
         ]
         
-        totals_table = Table(totals_data, colWidths=[1.5*inch, 1.5*inch])
-        totals_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 1), 10),
-            ('FONTSIZE', (0, 2), (-1, 2), 12),  # Total más grande
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 2), (-1, 2), colors.lightblue),  # Resaltar total
-        ]))
-        
-        # Tabla para alinear a la derecha
-        main_table = Table([[" ", totals_table]], colWidths=[4.5*inch, 3*inch])
-        
-        return [main_table]
+        return _build_totals_table(totals_data, _TOTALS_TABLE_STYLE)
 
     def _create_terms_section(self, terms: str):
         """Crear sección de términos y condiciones"""
-        header = Paragraph("Términos y Condiciones", self.header_style)
-        content = Paragraph(terms, self.styles['Normal'])
+        header = copy(_TERMINOS_HEADER)
+        content = _normal_paragraph(terms)
         
         return [header, content, Spacer(1, 12)]
 
     def _create_notes_section(self, notes: str):
         """Crear sección de notas"""
-        header = Paragraph("Notas Adicionales", self.header_style)
-        content = Paragraph(notes, self.styles['Normal'])
+        header = copy(_NOTAS_HEADER)
+        content = _normal_paragraph(notes)
         
         return [header, content, Spacer(1, 12)]
 
     def _create_footer(self):
         """Crear pie de página"""
         footer_text = f"Cotización generada el {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        footer = Paragraph(footer_text, self.styles['Normal'])
+        footer = Paragraph(footer_text, self.normal_style)
         
         return [Spacer(1, 20), HRFlowable(width="100%", thickness=0.5, color=colors.grey), footer]
 
     def generate_invoice_pdf(self, invoice: Invoice, db: Session = None) -> io.BytesIO:
-        """Generar PDF de factura y devolver como BytesIO buffer"""
+        """Generar PDF de factura y devolver como BytesIO buffer
+        
+        Los PDFs ya generados se reutilizan mientras no cambien la factura, el
+        cliente, los nombres de producto impresos ni los datos de la empresa.
+        """
+        # Resolver la empresa una sola vez: la misma se usa en la clave y en el PDF
+        company = self._get_company(db)
+        
+        if invoice.id is None:
+            return self._build_invoice_pdf(invoice, company)
+        
+        customer = invoice.customer
+        cache_key = (
+            invoice.id,
+            invoice.updated_at,
+            customer.updated_at if customer else None,
+            company,
+            # Nombres de producto que se imprimen en líneas sin descripción
+            tuple(line.product.name for line in invoice.lines if not line.description and line.product),
+        )
+        
+        # pop + reinserción: marca la entrada como la más reciente
+        pdf_bytes = self._invoice_pdf_cache.pop(cache_key, None)
+        if pdf_bytes is None:
+            pdf_bytes = self._build_invoice_pdf(invoice, company).getvalue()
+            if len(self._invoice_pdf_cache) >= INVOICE_PDF_CACHE_SIZE:
+                self._invoice_pdf_cache.popitem(last=False)
+        self._invoice_pdf_cache[cache_key] = pdf_bytes
+        
+        return io.BytesIO(pdf_bytes)
+
+    def _build_invoice_pdf(self, invoice: Invoice, company=None) -> io.BytesIO:
+        """Construir el PDF de factura con ReportLab"""
         
         # Crear buffer en memoria
         buffer = io.BytesIO()
@@ -293,40 +417,37 @@ class PDFGenerator:
             rightMargin=0.5*inch
         )
         
-        # Construir contenido
-        story = []
-        
-        # Encabezado de empresa paraguaya
-        story.extend(self._create_company_header(db))
-        story.append(Spacer(1, 20))
-        
-        # Título
-        title = Paragraph("FACTURA", self.title_style)
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        # Información de factura y cliente
-        story.extend(self._create_invoice_info(invoice))
-        story.append(Spacer(1, 20))
-        
-        # Tabla de productos/servicios
-        story.extend(self._create_invoice_items_table(invoice))
-        story.append(Spacer(1, 20))
-        
-        # Totales con desglose paraguayo
-        story.extend(self._create_paraguay_invoice_totals(invoice))
-        story.append(Spacer(1, 20))
-        
-        # Términos de pago
-        if invoice.payment_terms:
-            story.extend(self._create_payment_terms_section(invoice.payment_terms))
-        
-        # Notas adicionales
-        if invoice.notes:
-            story.extend(self._create_notes_section(invoice.notes))
-        
-        # Pie de página
-        story.extend(self._create_footer())
+        # Construir contenido en una sola lista
+        story = [
+            # Encabezado de empresa paraguaya
+            *self._create_company_header(company),
+            Spacer(1, 20),
+            
+            # Título
+            copy(_TITLE_FACTURA),
+            Spacer(1, 20),
+            
+            # Información de factura y cliente
+            *self._create_invoice_info(invoice),
+            Spacer(1, 20),
+            
+            # Tabla de productos/servicios
+            *self._create_invoice_items_table(invoice),
+            Spacer(1, 20),
+            
+            # Totales con desglose paraguayo
+            *self._create_paraguay_invoice_totals(invoice),
+            Spacer(1, 20),
+            
+            # Términos de pago
+            *(self._create_payment_terms_section(invoice.payment_terms) if invoice.payment_terms else ()),
+            
+            # Notas adicionales
+            *(self._create_notes_section(invoice.notes) if invoice.notes else ()),
+            
+            # Pie de página
+            *self._create_footer(),
+        ]
         
         # Construir PDF
         doc.build(story)
@@ -343,13 +464,8 @@ class PDFGenerator:
             ["Estado:", invoice.status.upper()]
         ]
         
-        invoice_table = Table(invoice_data, colWidths=[1.5*inch, 2*inch])
-        invoice_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        invoice_table = Table(invoice_data, colWidths=_INFO_COLWIDTHS)
+        invoice_table.setStyle(_INFO_TABLE_STYLE)
         
         # Información del cliente
         customer = invoice.customer
@@ -360,158 +476,81 @@ class PDFGenerator:
             ["Teléfono:", customer.phone or ""]
         ]
         
-        customer_table = Table(customer_data, colWidths=[1.5*inch, 2*inch])
-        customer_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        customer_table = Table(customer_data, colWidths=_INFO_COLWIDTHS)
+        customer_table.setStyle(_INFO_TABLE_STYLE)
         
         # Tabla combinada
-        main_table = Table([[invoice_table, customer_table]], colWidths=[3.5*inch, 3.5*inch])
-        main_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        main_table = Table([[invoice_table, customer_table]], colWidths=_INFO_MAIN_COLWIDTHS)
+        main_table.setStyle(_INFO_MAIN_STYLE)
         
         return [main_table]
 
     def _create_invoice_items_table(self, invoice: Invoice):
         """Crear tabla de productos/servicios de factura"""
-        # Encabezados
-        headers = ["Descripción", "Cantidad", "Precio Unit.", "Descuento", "Total"]
-        
-        # Datos de los productos
-        data = [headers]
-        
-        for line in invoice.lines:
-            product_name = line.product.name if line.product else "Producto"
-            description = line.description or product_name
-            
-            row = [
-                description,
-                str(line.quantity),
-                f"${line.unit_price:,.2f}",
-                f"{line.discount_percent}%",
-                f"${line.line_total:,.2f}"
-            ]
-            data.append(row)
-        
-        # Crear tabla
-        items_table = Table(data, colWidths=[2.5*inch, 0.8*inch, 1*inch, 0.8*inch, 1*inch])
-        items_table.setStyle(TableStyle([
-            # Encabezados
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            
-            # Datos
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),  # Alineación derecha para números
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),   # Alineación izquierda para descripción
-            
-            # Bordes
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Alternar colores de filas
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
-        
-        return [Paragraph("Detalle de Productos/Servicios", self.header_style), items_table]
+        return _build_items_table(invoice.lines)
 
     def _create_invoice_totals_table(self, invoice: Invoice):
         """Crear tabla de totales de factura"""
         totals_data = [
-            ["Subtotal:", f"${invoice.subtotal:,.2f}"],
-            ["IVA (16%):", f"${invoice.tax_amount:,.2f}"],
-            ["TOTAL:", f"${invoice.total_amount:,.2f}"],
-            ["Pagado:", f"${invoice.paid_amount:,.2f}"],
-            ["Saldo Pendiente:", f"${invoice.balance_due:,.2f}"]
+            ["Subtotal:", _FMT_MONEY(invoice.subtotal)],
+            ["IVA (16%):", _FMT_MONEY(invoice.tax_amount)],
+            ["TOTAL:", _FMT_MONEY(invoice.total_amount)],
+            ["Pagado:", _FMT_MONEY(invoice.paid_amount)],
+            ["Saldo Pendiente:", _FMT_MONEY(invoice.balance_due)]
         ]
         
-        totals_table = Table(totals_data, colWidths=[1.5*inch, 1.5*inch])
-        totals_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 3), 10),
-            ('FONTSIZE', (0, 2), (0, 2), 12),  # Total más grande
-            ('FONTSIZE', (0, 4), (0, 4), 11),  # Saldo pendiente destacado
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 2), (-1, 2), colors.lightblue),  # Resaltar total
-            ('BACKGROUND', (0, 4), (-1, 4), colors.lightyellow),  # Resaltar saldo
-        ]))
-        
-        # Tabla para alinear a la derecha
-        main_table = Table([[" ", totals_table]], colWidths=[4.5*inch, 3*inch])
-        
-        return [main_table]
+        return _build_totals_table(totals_data, _INVOICE_TOTALS_STYLE)
 
     def _create_payment_terms_section(self, terms: str):
         """Crear sección de términos de pago"""
-        header = Paragraph("Términos de Pago", self.header_style)
-        content = Paragraph(terms, self.styles['Normal'])
+        header = copy(_TERMINOS_PAGO_HEADER)
+        content = _normal_paragraph(terms)
         
         return [header, content, Spacer(1, 12)]
     
     def _create_paraguay_invoice_totals(self, invoice: Invoice):
         """Crear tabla de totales con desglose paraguayo"""
-        currency = getattr(invoice, 'currency', 'PYG')
+        # Leer una sola vez las columnas fiscales (el modelo Invoice las declara todas)
+        fmt = ParaguayFiscalUtils.make_formatter(invoice.currency)
+        iva_10 = invoice.iva_10
+        iva_5 = invoice.iva_5
         
         # Datos para la tabla de totales paraguaya
         totals_data = [
-            ["Subtotal Gravado 10%:", ParaguayFiscalUtils.format_currency(getattr(invoice, 'subtotal_gravado_10', 0), currency)],
-            ["Subtotal Gravado 5%:", ParaguayFiscalUtils.format_currency(getattr(invoice, 'subtotal_gravado_5', 0), currency)],
-            ["Subtotal Exento:", ParaguayFiscalUtils.format_currency(getattr(invoice, 'subtotal_exento', 0), currency)],
-            ["IVA 10%:", ParaguayFiscalUtils.format_currency(getattr(invoice, 'iva_10', 0), currency)],
-            ["IVA 5%:", ParaguayFiscalUtils.format_currency(getattr(invoice, 'iva_5', 0), currency)]
+            ["Subtotal Gravado 10%:", fmt(invoice.subtotal_gravado_10)],
+            ["Subtotal Gravado 5%:", fmt(invoice.subtotal_gravado_5)],
+            ["Subtotal Exento:", fmt(invoice.subtotal_exento)],
+            ["IVA 10%:", fmt(iva_10)],
+            ["IVA 5%:", fmt(iva_5)]
         ]
         
         # Agregar régimen turístico si aplica
-        if getattr(invoice, 'tourism_regime_applied', False):
-            tourism_percent = getattr(invoice, 'tourism_regime_percentage', 0)
+        if invoice.tourism_regime_applied:
+            tourism_percent = invoice.tourism_regime_percentage
             totals_data.append([f"Exención Turística ({tourism_percent}%):", 
-                               ParaguayFiscalUtils.format_currency(getattr(invoice, 'iva_10', 0) + getattr(invoice, 'iva_5', 0) - invoice.tax_amount, currency)])
+                               fmt(iva_10 + iva_5 - invoice.tax_amount)])
         
         totals_data.extend([
-            ["TOTAL:", ParaguayFiscalUtils.format_currency(invoice.total_amount, currency)],
-            ["Pagado:", ParaguayFiscalUtils.format_currency(invoice.paid_amount, currency)],
-            ["Saldo Pendiente:", ParaguayFiscalUtils.format_currency(invoice.balance_due, currency)]
+            ["TOTAL:", fmt(invoice.total_amount)],
+            ["Pagado:", fmt(invoice.paid_amount)],
+            ["Saldo Pendiente:", fmt(invoice.balance_due)]
         ])
         
         # Información fiscal adicional
         fiscal_info = [
-            ["Condición de Venta:", ParaguayFiscalUtils.get_condicion_venta_display(getattr(invoice, 'condicion_venta', 'CREDITO'))],
-            ["Lugar de Emisión:", getattr(invoice, 'lugar_emision', 'Asunción')]
+            ["Condición de Venta:", ParaguayFiscalUtils.get_condicion_venta_display(invoice.condicion_venta)],
+            ["Lugar de Emisión:", invoice.lugar_emision]
         ]
         
-        totals_table = Table(totals_data, colWidths=[2*inch, 1.5*inch])
-        totals_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -3), 9),
-            ('FONTSIZE', (0, -3), (0, -3), 11),  # Total más grande
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, -3), (-1, -3), colors.lightblue),  # Resaltar total
-            ('BACKGROUND', (0, -1), (-1, -1), colors.lightyellow),  # Resaltar saldo
-        ]))
-        
-        fiscal_table = Table(fiscal_info, colWidths=[2*inch, 1.5*inch])
-        fiscal_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        totals_table = Table(totals_data, colWidths=_PY_TOTALS_COLWIDTHS)
+        totals_table.setStyle(_PY_TOTALS_STYLE)
+        
+        fiscal_table = Table(fiscal_info, colWidths=_PY_TOTALS_COLWIDTHS)
+        fiscal_table.setStyle(_FISCAL_TABLE_STYLE)
         
         # Tabla principal para alinear a la derecha
-        main_table = Table([[" ", totals_table]], colWidths=[3.5*inch, 3.5*inch])
-        fiscal_main_table = Table([[" ", fiscal_table]], colWidths=[3.5*inch, 3.5*inch])
+        main_table = Table([[" ", totals_table]], colWidths=_PY_TOTALS_MAIN_COLWIDTHS)
+        fiscal_main_table = Table([[" ", fiscal_table]], colWidths=_PY_TOTALS_MAIN_COLWIDTHS)
         
         return [main_table, Spacer(1, 10), fiscal_main_table]
 
@@ -4,10 +4,26 @@ Incluye validación de RUC, cálculos de IVA, y validaciones de timbrado
 """
 
 import re
+from functools import lru_cache
 from datetime import date, datetime
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, Callable
 from decimal import Decimal
 
+# Cero compartido para montos que no aplican (Decimal es inmutable)
+_ZERO = Decimal("0")
+
+# Caracteres a descartar al limpiar RUC, timbrado y punto de expedición
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+def _digits_only(value: str) -> str:
+    """Dejar solo los dígitos 0-9; si el valor ya está limpio no pasa por la regex"""
+    if value.isascii() and value.isdigit():
+        return value
+    return _NON_DIGITS.sub('', value)
+
+# Multiplicadores del módulo 11 del RUC, aplicados desde el último dígito
+_RUC_MULTIPLIERS = (2, 3, 4, 5, 6, 7, 2, 3, 4)
+
 class ParaguayFiscalValidator:
     """Validador fiscal para Paraguay"""
     
@@ -22,6 +38,13 @@ class ParaguayFiscalValidator:
         Returns:
             Dict con resultado de validación y información extraída
         """
+        # Copia del resultado cacheado para que el llamador pueda modificarlo
+        return dict(ParaguayFiscalValidator._validate_ruc(ruc))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _validate_ruc(ruc: str) -> Dict[str, Any]:
+        """Validación de RUC cacheada por valor (los mismos RUC se validan repetidamente)"""
         if not ruc:
             return {
                 "valid": False,
@@ -31,7 +54,7 @@ class ParaguayFiscalValidator:
             }
         
         # Limpiar RUC (remover espacios y guiones)
-        ruc_clean = re.sub(r'[^0-9]', '', ruc)
+        ruc_clean = _digits_only(ruc)
         
         if len(ruc_clean) < 6:
             return {
@@ -100,16 +123,9 @@ class ParaguayFiscalValidator:
         if not ruc_base or not ruc_base.isdigit():
             return 0
         
-        # Algoritmo módulo 11 para RUC paraguayo
-        multipliers = [2, 3, 4, 5, 6, 7, 2, 3, 4]
-        total = 0
-        
-        # Procesar desde el último dígito hacia el primero
-        ruc_reversed = ruc_base[::-1]
-        
-        for i, digit in enumerate(ruc_reversed):
-            if i < len(multipliers):
-                total += int(digit) * multipliers[i]
+        # Algoritmo módulo 11 para RUC paraguayo: desde el último dígito hacia
+        # el primero (zip descarta los dígitos que exceden los multiplicadores)
+        total = sum(int(digit) * multiplier for digit, multiplier in zip(reversed(ruc_base), _RUC_MULTIPLIERS))
         
         remainder = total % 11
         
@@ -137,7 +153,7 @@ class ParaguayFiscalValidator:
             }
         
         # Limpiar timbrado
-        timbrado_clean = re.sub(r'[^0-9]', '', timbrado)
+        timbrado_clean = _digits_only(timbrado)
         
         if not timbrado_clean.isdigit():
             return {
@@ -209,7 +225,7 @@ class ParaguayIVACalculator:
         Calcular desglose de IVA paraguayo
         
         Args:
-            lines: Lista de líneas con iva_category y line_total
+            lines: Lista de líneas con iva_category y line_total (idealmente ya Decimal)
             iva_10_rate: Tasa de IVA 10%
             iva_5_rate: Tasa de IVA 5%
             
@@ -221,8 +237,12 @@ class ParaguayIVACalculator:
         subtotal_exento = Decimal("0")
         
         for line in lines:
-            line_total = Decimal(str(line.get("line_total", 0)))
-            iva_category = line.get("iva_category", "10").upper()
+            line_total = line.get("line_total", 0)
+            if not isinstance(line_total, Decimal):
+                # Pasar por str() para no arrastrar la representación binaria de los float
+                line_total = Decimal(str(line_total))
+            # "10" y "5" son dígitos: comparar directo, sin normalizar mayúsculas por línea
+            iva_category = line.get("iva_category", "10")
             
             if iva_category == "10":
                 subtotal_gravado_10 += line_total
@@ -252,13 +272,15 @@ class ParaguayIVACalculator:
     
     @staticmethod
     def apply_tourism_regime(totals: Dict[str, Decimal], 
-                           tourism_percentage: Decimal = Decimal("0")) -> Dict[str, Decimal]:
+                           tourism_percentage: Decimal = Decimal("0"),
+                           in_place: bool = False) -> Dict[str, Decimal]:
         """
         Aplicar régimen turístico paraguayo
         
         Args:
             totals: Totales calculados sin régimen turístico
             tourism_percentage: Porcentaje de exención turística
+            in_place: Modificar ``totals`` directamente en lugar de una copia
             
         Returns:
             Totales con régimen turístico aplicado
@@ -269,13 +291,13 @@ class ParaguayIVACalculator:
         # Calcular descuento por régimen turístico
         tourism_discount_factor = tourism_percentage / Decimal("100")
         
-        # El régimen turístico aplica sobre el IVA
-        iva_10_discount = totals["iva_10"] * tourism_discount_factor
-        iva_5_discount = totals["iva_5"] * tourism_discount_factor
+        # El régimen turístico aplica sobre el IVA (la mayoría de las facturas no tiene IVA 5%)
+        iva_10_discount = totals["iva_10"] * tourism_discount_factor if totals["iva_10"] else _ZERO
+        iva_5_discount = totals["iva_5"] * tourism_discount_factor if totals["iva_5"] else _ZERO
         total_iva_discount = iva_10_discount + iva_5_discount
         
         # Actualizar totales
-        new_totals = totals.copy()
+        new_totals = totals if in_place else totals.copy()
         new_totals["iva_10"] -= iva_10_discount
         new_totals["iva_5"] -= iva_5_discount
         new_totals["total_iva"] -= total_iva_discount
@@ -308,7 +330,7 @@ class ParaguayFiscalUtils:
             return "001"
         
         # Limpiar y formatear con 3 dígitos
-        punto_clean = re.sub(r'[^0-9]', '', punto)
+        punto_clean = _digits_only(punto)
         return punto_clean.zfill(3)
     
     @staticmethod
@@ -320,4 +342,18 @@ class ParaguayFiscalUtils:
         elif currency == "USD":
             return f"US$ {amount:,.2f}"
         else:
-            return f"{amount:,.2f} {currency}"
\ No newline at end of file
+            return f"{amount:,.2f} {currency}"
+    
+    @staticmethod
+    def make_formatter(currency: str = "PYG") -> Callable[[Decimal], str]:
+        """Crear formateador de montos para una moneda (mismo formato que format_currency)
+
+        Resuelve la moneda una sola vez; útil al formatear varios montos de un documento.
+        """
+        if currency == "PYG":
+            pyg_format = "{:,.0f} Gs.".format
+            return lambda amount: pyg_format(amount).replace(",", ".")
+        elif currency == "USD":
+            return "US$ {:,.2f}".format
+        else:
+            return lambda amount: f"{amount:,.2f} {currency}"
@@ -12,9 +12,11 @@ def create_admin_user():
     
     try:
         # Verificar si ya existe el usuario admin
-        existing_admin = db.query(User).filter(User.username == "admin").first()
+        admin_exists = db.query(
+            db.query(User).filter(User.username == "admin").exists()
+        ).scalar()
         
-        if existing_admin:
+        if admin_exists:
             print("✅ El usuario admin ya existe")
             print("=" * 50)
             print("📧 Usuario: admin")
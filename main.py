@@ -12,15 +12,22 @@ load_dotenv()
 
 # Importar configuración de base de datos unificada
 from app.core.database import engine, Base, get_database
+from app.core.config import settings
 
 # Importar todos los modelos para que las tablas se creen
 from app.models import user, customer, product, sales, invoice, deposit, company
 
+# Página de entrada de la SPA de React
+SPA_INDEX_PATH = "frontend/dist/index.html"
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Código de inicio
     print("Iniciando el sistema de gestión de ventas...")
     print("Base de datos configurada - usar 'alembic upgrade head' para crear tablas")
+    # El index.html de la SPA no cambia entre despliegues: leerlo una sola vez
+    with open(SPA_INDEX_PATH, "rb") as f:
+        app.state.index_html = f.read()
     yield
     # Código de limpieza al cerrar
     print("Cerrando el sistema de gestión de ventas...")
@@ -33,10 +40,10 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Configurar CORS para producción
+# Configurar CORS para producción (CORS_ORIGINS define la lista explícita de orígenes)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Temporalmente permitir todos los orígenes para debugging
+    allow_origins=settings.backend_cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -84,10 +91,19 @@ async def api_info():
     }
 
 # Servir la interfaz React SPA
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
+
+def spa_index_response() -> Response:
+    """index.html de la SPA desde memoria (no-cache para que el navegador revalide)"""
+    return Response(
+        content=app.state.index_html,
+        media_type="text/html",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.get("/")
 async def main():
-    return FileResponse('frontend/dist/index.html')
+    return spa_index_response()
 
 # Servir rutas de React Router (SPA)
 @app.get("/{path:path}")
@@ -99,7 +115,7 @@ async def serve_spa(path: str):
         raise HTTPException(status_code=404, detail="API endpoint not found")
     
     # Para todas las demás rutas, servir el index.html para que React Router maneje la navegación
-    return FileResponse('frontend/dist/index.html')
+    return spa_index_response()
 
 # Ruta de health check
 @app.get("/health")